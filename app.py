@@ -1,50 +1,194 @@
-import os
+import codecs
+import copy
+import json
 import platform
-import subprocess
 import sys
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 
-from PySide6.QtCore import QFileInfo, QMimeData, QPoint, QRect, QSize, Qt
-from PySide6.QtGui import QColor, QDrag, QIcon, QPalette
+from PySide6.QtCore import (
+    QEvent,
+    QFileInfo,
+    QFileSystemWatcher,
+    QMimeData,
+    QObject,
+    QRect,
+    QRectF,
+    QSize,
+    Qt,
+    QThread,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import (
+    QColor,
+    QDrag,
+    QIcon,
+    QKeySequence,
+    QLinearGradient,
+    QPainter,
+    QPalette,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+    QShortcut,
+    QTextCursor,
+)
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
+    QCheckBox,
+    QComboBox,
     QDialog,
     QFileDialog,
     QFileIconProvider,
+    QFormLayout,
     QFrame,
+    QGroupBox,
     QHBoxLayout,
+    QHeaderView,
+    QInputDialog,
     QLayout,
     QLabel,
     QLineEdit,
     QListWidget,
     QListWidgetItem,
+    QMenu,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QScrollArea,
     QSizePolicy,
     QSpacerItem,
+    QSpinBox,
+    QStackedWidget,
     QStyle,
+    QTabBar,
+    QTableWidget,
+    QTableWidgetItem,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+from capture import (
+    OUTPUT_CAPTURE,
+    OUTPUT_INHERIT,
+    OUTPUT_LOG,
+    OutputCapture,
+    log_file_name,
+)
 from core import (
-    determine_launch,
+    HEALTH_MISSING,
+    HEALTH_NOT_EXECUTABLE,
+    TileHealthChecker,
+    TileStore,
+    board_index,
+    desktop_app_to_tile,
+    import_tiles_file,
     list_desktop_apps,
-    load_tiles_file,
+    matches_search,
+    merge_board_data,
+    merge_tiles,
+    move_tile,
+    parse_desktop_file,
     reorder_tiles,
     save_tiles_file,
+    search_terms,
+    tile_key,
+    tile_search_text,
+    unique_board_name,
+)
+from launcher import (
+    IONICE_CLASSES,
+    InstanceLimiter,
+    LaunchError,
+    LaunchGroupRunner,
+    ProcessScanner,
+    find_group_tile,
+    focus_window,
+    format_cpu_list,
+    format_wait_for,
+    instance_matcher,
+    normalize_launch_policy,
+    parse_cpu_list,
+    parse_wait_for,
+    prune_group_members,
+    rename_group_members,
+    resolve_tile_launch,
+    start_launch,
+    validate_launch_group,
+)
+from sync import (
+    SYNC_CONFIG_FILE,
+    SYNC_INTERVAL,
+    SYNC_STATE_FILE,
+    SyncClient,
+    SyncError,
+    load_sync_config,
 )
+import tracing
+from tracing import traced
 
 APP_NAME = "AppBoard"
 DATA_FILE = Path(__file__).with_name("shortcuts.json")
+LOG_DIR = Path(__file__).with_name("logs")
+BOARD_CACHE_SIZE = 3
+RELOAD_DEBOUNCE_MS = 250
+EMPTY_BOARD_TEXT = "No tiles yet. Add your first shortcut to get started."
+NO_MATCHES_TEXT = "No tiles match your filter."
+TILE_MIME_TYPE = "application/x-appboard-tile"
+HEALTH_CHECK_INTERVAL_MS = 60000
+TILE_RADIUS = 16
+TILE_CHROME = {
+    "normal": ("#ffffff", "#f1e7dc", "#e0d6c9"),
+    "unhealthy": ("#ffffff", "#f1e7dc", "#c0392b"),
+}
+BUTTON_RADIUS = 8
+BUTTON_PADDING = (12, 6)
+BUTTON_CHROME = {
+    "primary": {"text": "#ffffff", "normal": "#1f1f1f", "hover": "#3b3b3b", "border": None},
+    "edit": {"text": "#1f1f1f", "normal": "#ffffff", "hover": "#f7f0e6", "border": "#d2c9bc"},
+    "remove": {"text": "#1f1f1f", "normal": "#ffffff", "hover": "#f0e8dd", "border": "#d2c9bc"},
+}
+OPTIONAL_TILE_KEYS = ("policy", "output", "single_instance")
+OUTPUT_POLL_MS = 200
+OUTPUT_VIEW_MAX_LINES = 5000
+OUTPUT_LABELS = {
+    OUTPUT_INHERIT: "Inherit terminal",
+    OUTPUT_CAPTURE: "Capture (recent output only)",
+    OUTPUT_LOG: "Capture and write log files",
+}
+TRACE_OVERLAY_SPANS = 15
+TRACE_OVERLAY_INTERVAL_MS = 500
+IONICE_LABELS = {"realtime": "Real-time", "best-effort": "Best effort", "idle": "Idle"}
+HEALTH_MESSAGES = {
+    HEALTH_MISSING: "Target not found",
+    HEALTH_NOT_EXECUTABLE: "Target is not executable",
+}
 
 
 class FlowLayout(QLayout):
+    # Items are placed in rows, but only widgets inside the visible part of the parent are
+    # shown; the rest stay hidden with stale geometry. Filtering or scrolling a board of
+    # thousands of tiles therefore only shows, hides and moves about a screenful of them.
+    # Item sizes are read once per item, as tiles have a fixed size.
     def __init__(self, parent=None, margin=0, spacing=10):
         super().__init__(parent)
         self._items = []
+        self._widgets = []
+        self._sizes = {}
+        self._included = None
+        self._layouts = {}
+        self._filtered_layouts = {}
+        self._placed = None
+        self._shown = {}
+        self._placing = False
+        self._minimum_size = None
         self.setContentsMargins(margin, margin, margin, margin)
         self.setSpacing(spacing)
 
@@ -54,7 +198,17 @@ class FlowLayout(QLayout):
             item = self.takeAt(0)
 
     def addItem(self, item):
+        widget = item.widget()
+        if widget is not None:
+            # Shown again by show_visible once it is laid out inside the visible area.
+            widget.hide()
+            self._shown.pop(widget, None)
+            hint = widget.sizeHint().expandedTo(widget.minimumSize())
+            hint = hint.boundedTo(widget.maximumSize())
+            self._sizes[widget] = (hint.width(), hint.height())
         self._items.append(item)
+        self._widgets.append(widget)
+        self._clear_cache()
 
     def count(self):
         return len(self._items)
@@ -66,9 +220,33 @@ class FlowLayout(QLayout):
 
     def takeAt(self, index):
         if 0 <= index < len(self._items):
+            widget = self._widgets.pop(index)
+            self._sizes.pop(widget, None)
+            if self._included is not None:
+                self._included.pop(widget, None)
+            self._shown.pop(widget, None)
+            self._clear_cache()
             return self._items.pop(index)
         return None
 
+    def widgets(self):
+        return [widget for widget in self._widgets if widget is not None]
+
+    def set_included(self, widgets):
+        # None lays out every item; otherwise only the given widgets, in layout order.
+        included = None if widgets is None else dict.fromkeys(widgets)
+        if included == self._included:
+            return
+        self._included = included
+        self._filtered_layouts.clear()
+        self._placed = None
+        # Re-place at the current size right away; a full update() would also make Qt
+        # visit every item. The parent then only needs to learn its new height.
+        if self.geometry().isValid():
+            self.setGeometry(self.geometry())
+        if self.parentWidget() is not None:
+            self.parentWidget().updateGeometry()
+
     def expandingDirections(self):
         return Qt.Orientations(Qt.Orientation(0))
 
@@ -76,43 +254,120 @@ class FlowLayout(QLayout):
         return True
 
     def heightForWidth(self, width):
-        return self._do_layout(QRect(0, 0, width, 0), True)
+        return self._do_layout(QRect(0, 0, width, 0))[0]
+
+    def invalidate(self):
+        # Showing or hiding a child asks its parent layout to run again; show_visible
+        # does that itself and it never changes where items go.
+        if not self._placing:
+            super().invalidate()
+
+    def _clear_cache(self):
+        self._minimum_size = None
+        self._layouts.clear()
+        self._filtered_layouts.clear()
+        # The last placement may name removed widgets; show_visible redoes it on demand.
+        self._placed = None
 
     def setGeometry(self, rect):
         super().setGeometry(rect)
-        self._do_layout(rect, False)
+        self._placed = self._do_layout(rect)
+        self.show_visible()
 
     def sizeHint(self):
         return self.minimumSize()
 
     def minimumSize(self):
-        size = QSize()
-        for item in self._items:
-            size = size.expandedTo(item.minimumSize())
-        margins = self.contentsMargins()
-        size += QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
-        return size
-
-    def _do_layout(self, rect, test_only):
-        x = rect.x()
-        y = rect.y()
-        line_height = 0
+        if self._minimum_size is None:
+            width = max((size[0] for size in self._sizes.values()), default=0)
+            height = max((size[1] for size in self._sizes.values()), default=0)
+            margins = self.contentsMargins()
+            self._minimum_size = QSize(
+                width + margins.left() + margins.right(), height + margins.top() + margins.bottom()
+            )
+        return QSize(self._minimum_size)
+
+    def show_visible(self):
+        parent = self.parentWidget()
+        area = parent.visibleRegion().boundingRect() if parent is not None else QRect()
+        if self._placed is None:
+            self._placed = self._do_layout(self.geometry())
+        _, tops, lefts, widgets, row_height = self._placed
+        wanted = {}
+        if not area.isEmpty():
+            start = bisect_left(tops, area.top() - row_height)
+            end = bisect_right(tops, area.bottom())
+            for index in range(start, end):
+                widget = widgets[index]
+                width, height = self._sizes[widget]
+                if tops[index] + height > area.top():
+                    wanted[widget] = (lefts[index], tops[index], width, height)
+        shown = self._shown
+        self._placing = True
+        try:
+            for widget in shown.keys() - wanted.keys():
+                widget.hide()
+            for widget, geometry in wanted.items():
+                if shown.get(widget) != geometry:
+                    widget.setGeometry(*geometry)
+                    widget.show()
+        finally:
+            self._placing = False
+        self._shown = wanted
+
+    def _do_layout(self, rect):
+        # The unfiltered layouts survive filter changes, so clearing a filter is cheap.
+        layouts = self._layouts if self._included is None else self._filtered_layouts
+        key = (rect.x(), rect.y(), rect.width())
+        layout = layouts.get(key)
+        if layout is None:
+            layout = layouts[key] = self._compute_layout(rect)
+        return layout
+
+    @traced("FlowLayout._do_layout")
+    def _compute_layout(self, rect):
+        # Returns (height, tops, lefts, widgets, tallest item) with one entry per placed
+        # widget, sorted by top.
+        x = left = rect.x()
+        y = top = rect.y()
+        right = rect.right()
+        spacing = self.spacing()
+        sizes = self._sizes
+        if self._included is None:
+            widgets = [widget for widget in self._widgets if widget is not None]
+        else:
+            widgets = list(self._included)
+        distinct = set(sizes.values())
+        if len(distinct) == 1:
+            # Same-sized items (the usual board of tiles) fill rows of a fixed width.
+            ((width, height),) = distinct
+            columns = max(1, (rect.width() - 1 + spacing) // (width + spacing))
+            count = len(widgets)
+            tops = [top + index // columns * (height + spacing) for index in range(count)]
+            lefts = [left + index % columns * (width + spacing) for index in range(count)]
+            rows = -(-count // columns)
+            return max(0, rows * (height + spacing) - spacing), tops, lefts, widgets, height
 
-        for item in self._items:
-            next_x = x + item.sizeHint().width() + self.spacing()
-            if next_x - self.spacing() > rect.right() and line_height > 0:
-                x = rect.x()
-                y += line_height + self.spacing()
-                next_x = x + item.sizeHint().width() + self.spacing()
+        line_height = 0
+        row_height = 0
+        tops = []
+        lefts = []
+        for widget in widgets:
+            width, height = sizes[widget]
+            if x + width > right and line_height > 0:
+                x = left
+                y += line_height + spacing
                 line_height = 0
 
-            if not test_only:
-                item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+            tops.append(y)
+            lefts.append(x)
 
-            x = next_x
-            line_height = max(line_height, item.sizeHint().height())
+            x += width + spacing
+            if height > line_height:
+                line_height = height
+                row_height = max(row_height, height)
 
-        return y + line_height - rect.y()
+        return y + line_height - top, tops, lefts, widgets, row_height
 
 
 class AddTileDialog(QDialog):
@@ -140,6 +395,44 @@ class AddTileDialog(QDialog):
         self.desc_input.setPlaceholderText("Description")
         self.desc_input.setFixedHeight(90)
 
+        self.output_input = QComboBox()
+        for mode, label in OUTPUT_LABELS.items():
+            self.output_input.addItem(label, mode)
+        self.single_instance_input = QCheckBox(
+            "Switch to the running copy instead of starting another"
+        )
+
+        self.policy_box = QGroupBox("Launch policy")
+        policy_form = QFormLayout(self.policy_box)
+        self.nice_input = QSpinBox()
+        self.nice_input.setRange(-21, 19)
+        self.nice_input.setSpecialValueText("Default")
+        self.nice_input.setValue(-21)
+        self.ionice_input = QComboBox()
+        self.ionice_input.addItem("Default", None)
+        for io_class in IONICE_CLASSES:
+            self.ionice_input.addItem(IONICE_LABELS[io_class], io_class)
+        self.cpus_input = QLineEdit()
+        self.cpus_input.setPlaceholderText("All CPUs (e.g. 0-3,6)")
+        self.memory_input = QSpinBox()
+        self.memory_input.setRange(0, 1024 * 1024)
+        self.memory_input.setSpecialValueText("Unlimited")
+        self.memory_input.setSuffix(" MB")
+        self.open_files_input = QSpinBox()
+        self.open_files_input.setRange(0, 1024 * 1024)
+        self.open_files_input.setSpecialValueText("Unlimited")
+        self.instances_input = QSpinBox()
+        self.instances_input.setRange(0, 100)
+        self.instances_input.setSpecialValueText("Unlimited")
+        policy_form.addRow("Nice level", self.nice_input)
+        policy_form.addRow("I/O priority", self.ionice_input)
+        policy_form.addRow("CPU affinity", self.cpus_input)
+        policy_form.addRow("Memory limit", self.memory_input)
+        policy_form.addRow("Open files limit", self.open_files_input)
+        policy_form.addRow("Max running instances", self.instances_input)
+        self.policy_box.setVisible(platform.system() == "Linux")
+        self._policy = {}
+
         button_row = QHBoxLayout()
         button_row.addItem(QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
         cancel_button = QPushButton("Cancel")
@@ -156,6 +449,10 @@ class AddTileDialog(QDialog):
         layout.addLayout(path_row)
         layout.addWidget(QLabel("Description"))
         layout.addWidget(self.desc_input)
+        layout.addWidget(QLabel("Output"))
+        layout.addWidget(self.output_input)
+        layout.addWidget(self.single_instance_input)
+        layout.addWidget(self.policy_box)
         layout.addLayout(button_row)
 
         self.path_input.setReadOnly(path_readonly)
@@ -167,6 +464,32 @@ class AddTileDialog(QDialog):
             self.name_input.setText(defaults.get("name", ""))
             self.path_input.setText(defaults.get("path", ""))
             self.desc_input.setText(defaults.get("description", ""))
+            index = self.output_input.findData(defaults.get("output", OUTPUT_INHERIT))
+            self.output_input.setCurrentIndex(max(index, 0))
+            self.single_instance_input.setChecked(bool(defaults.get("single_instance")))
+            self._set_policy(defaults.get("policy") or {})
+
+    def _set_policy(self, policy):
+        self._policy = dict(policy)
+        if policy.get("nice") is not None:
+            self.nice_input.setValue(policy["nice"])
+        index = self.ionice_input.findData(policy.get("ionice"))
+        self.ionice_input.setCurrentIndex(max(index, 0))
+        self.cpus_input.setText(format_cpu_list(policy.get("cpus", [])))
+        self.memory_input.setValue(policy.get("max_memory_mb", 0))
+        self.open_files_input.setValue(policy.get("max_open_files", 0))
+        self.instances_input.setValue(policy.get("max_instances", 0))
+
+    def _policy_values(self):
+        policy = dict(self._policy)
+        nice = self.nice_input.value()
+        policy["nice"] = None if nice == self.nice_input.minimum() else nice
+        policy["ionice"] = self.ionice_input.currentData()
+        policy["cpus"] = parse_cpu_list(self.cpus_input.text())
+        policy["max_memory_mb"] = self.memory_input.value()
+        policy["max_open_files"] = self.open_files_input.value()
+        policy["max_instances"] = self.instances_input.value()
+        return normalize_launch_policy(policy)
 
     def _browse(self):
         path, _ = QFileDialog.getOpenFileName(self, "Select application or script")
@@ -181,14 +504,27 @@ class AddTileDialog(QDialog):
         if not name or not path:
             QMessageBox.warning(self, "Missing info", "Name and path are required.")
             return
+        try:
+            self._policy_values()
+        except ValueError as exc:
+            QMessageBox.warning(self, "Invalid launch policy", str(exc))
+            return
         self.accept()
 
     def values(self):
-        return {
+        values = {
             "name": self.name_input.text().strip(),
             "path": self.path_input.text().strip(),
             "description": self.desc_input.toPlainText().strip(),
         }
+        if self.output_input.currentData() != OUTPUT_INHERIT:
+            values["output"] = self.output_input.currentData()
+        if self.single_instance_input.isChecked():
+            values["single_instance"] = True
+        policy = self._policy_values()
+        if policy:
+            values["policy"] = policy
+        return values
 
 
 class DebianAppDialog(QDialog):
@@ -199,6 +535,7 @@ class DebianAppDialog(QDialog):
         self.setMinimumWidth(520)
         self._apps = apps
         self._filtered_apps = []
+        self._add_all = False
 
         layout = QVBoxLayout(self)
         layout.setSpacing(10)
@@ -208,16 +545,20 @@ class DebianAppDialog(QDialog):
         self.filter_input.textChanged.connect(self._refresh_list)
 
         self.list_widget = QListWidget()
+        self.list_widget.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.list_widget.itemDoubleClicked.connect(lambda _: self._accept())
 
         button_row = QHBoxLayout()
         button_row.addItem(QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
         cancel_button = QPushButton("Cancel")
         cancel_button.clicked.connect(self.reject)
+        add_all_button = QPushButton("Add All Matching")
+        add_all_button.clicked.connect(self._accept_all)
         add_button = QPushButton("Add")
         add_button.clicked.connect(self._accept)
         add_button.setDefault(True)
         button_row.addWidget(cancel_button)
+        button_row.addWidget(add_all_button)
         button_row.addWidget(add_button)
 
         layout.addWidget(self.filter_input)
@@ -246,16 +587,366 @@ class DebianAppDialog(QDialog):
             self.list_widget.setCurrentRow(0)
 
     def _accept(self):
-        if not self.list_widget.currentItem():
+        if not self.list_widget.selectedItems():
             QMessageBox.warning(self, "Select app", "Pick an application to add.")
             return
+        self._add_all = False
         self.accept()
 
-    def selected_app(self):
-        item = self.list_widget.currentItem()
-        if not item:
-            return None
-        return item.data(Qt.UserRole)
+    def _accept_all(self):
+        if not self._filtered_apps:
+            QMessageBox.warning(self, "Select app", "No applications match the filter.")
+            return
+        self._add_all = True
+        self.accept()
+
+    def selected_apps(self):
+        if self._add_all:
+            return list(self._filtered_apps)
+        rows = sorted(self.list_widget.row(item) for item in self.list_widget.selectedItems())
+        return [self.list_widget.item(row).data(Qt.UserRole) for row in rows]
+
+
+class LaunchGroupDialog(QDialog):
+    def __init__(self, tile_names, group=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Edit Launch Group" if group else "New Launch Group")
+        self.setModal(True)
+        self.setMinimumSize(640, 420)
+        group = group or {}
+        members = {member["tile"]: member for member in group.get("members", [])}
+        self._members = members
+        names = list(members) + [name for name in tile_names if name not in members]
+
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+
+        self.name_input = QLineEdit(group.get("name", ""))
+        self.name_input.setPlaceholderText("Group name")
+
+        self.table = QTableWidget(len(names), 4)
+        self.table.setHorizontalHeaderLabels(["Tile", "Start after", "Delay (s)", "Wait for"])
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        for row, name in enumerate(names):
+            member = members.get(name, {})
+            tile_item = QTableWidgetItem(name)
+            tile_item.setFlags(Qt.ItemIsEnabled | Qt.ItemIsUserCheckable)
+            tile_item.setCheckState(Qt.Checked if name in members else Qt.Unchecked)
+            self.table.setItem(row, 0, tile_item)
+            self.table.setItem(row, 1, QTableWidgetItem(", ".join(member.get("after", []))))
+            delay = member.get("delay")
+            self.table.setItem(row, 2, QTableWidgetItem(f"{delay:g}" if delay else ""))
+            self.table.setItem(row, 3, QTableWidgetItem(format_wait_for(member.get("wait_for"))))
+
+        hint = QLabel(
+            "Tick the tiles to start. Unordered tiles start together; 'Wait for' takes "
+            "port:5432, port:host:5432 or file:/path."
+        )
+        hint.setWordWrap(True)
+        hint.setObjectName("tileDesc")
+
+        button_row = QHBoxLayout()
+        button_row.addItem(QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum))
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(self.reject)
+        save_button = QPushButton("Save")
+        save_button.clicked.connect(self._accept)
+        save_button.setDefault(True)
+        button_row.addWidget(cancel_button)
+        button_row.addWidget(save_button)
+
+        layout.addWidget(QLabel("Group name"))
+        layout.addWidget(self.name_input)
+        layout.addWidget(self.table, 1)
+        layout.addWidget(hint)
+        layout.addLayout(button_row)
+        self._group = None
+
+    def _accept(self):
+        name = self.name_input.text().strip()
+        if not name:
+            QMessageBox.warning(self, "Missing info", "A group name is required.")
+            return
+        members = []
+        try:
+            for row in range(self.table.rowCount()):
+                if self.table.item(row, 0).checkState() != Qt.Checked:
+                    continue
+                tile_name = self.table.item(row, 0).text()
+                member = {
+                    key: value
+                    for key, value in self._members.get(tile_name, {}).items()
+                    if key not in ("after", "delay", "wait_for")
+                }
+                member["tile"] = tile_name
+                after = [part.strip() for part in self.table.item(row, 1).text().split(",")]
+                if any(after):
+                    member["after"] = [part for part in after if part]
+                delay_text = self.table.item(row, 2).text().strip()
+                if delay_text:
+                    member["delay"] = float(delay_text)
+                wait_for = parse_wait_for(self.table.item(row, 3).text())
+                if wait_for:
+                    member["wait_for"] = wait_for
+                members.append(member)
+            if not members:
+                raise ValueError("Tick at least one tile.")
+            group = {"name": name, "members": members}
+            validate_launch_group(group)
+        except ValueError as exc:
+            QMessageBox.warning(self, "Invalid group", str(exc))
+            return
+        self._group = group
+        self.accept()
+
+    def values(self):
+        return self._group
+
+
+class LaunchProgressDialog(QDialog):
+    def __init__(self, group, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Launching {group['name']}")
+        self.setMinimumWidth(420)
+        self._items = {}
+        self.runner = None
+
+        layout = QVBoxLayout(self)
+        self.list_widget = QListWidget()
+        for member in group["members"]:
+            item = QListWidgetItem(member["tile"])
+            self._items[member["tile"]] = item
+            self.list_widget.addItem(item)
+        self.close_button = QPushButton("Cancel")
+        self.close_button.clicked.connect(self._cancel_or_close)
+        button_row = QHBoxLayout()
+        button_row.addStretch()
+        button_row.addWidget(self.close_button)
+        layout.addWidget(self.list_widget, 1)
+        layout.addLayout(button_row)
+
+    def update_member(self, name, status, detail):
+        item = self._items.get(name)
+        if item:
+            item.setText(f"{name} \u2014 {status}" + (f" ({detail})" if detail else ""))
+
+    def finish(self):
+        self.runner = None
+        self.close_button.setText("Close")
+
+    def closeEvent(self, event):
+        if self.runner:
+            self.runner.cancel()
+        super().closeEvent(event)
+
+    def reject(self):
+        if self.runner:
+            self.runner.cancel()
+        super().reject()
+
+    def _cancel_or_close(self):
+        if self.runner:
+            self.runner.cancel()
+        else:
+            self.close()
+
+
+class OutputViewerDialog(QDialog):
+    def __init__(self, output_capture, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Output")
+        self.resize(760, 480)
+        self._capture = output_capture
+        self._runs = []
+        self._run = None
+        self._offset = 0
+        self._decoder = None
+
+        layout = QVBoxLayout(self)
+        self.run_input = QComboBox()
+        self.run_input.currentIndexChanged.connect(self._select_run)
+        self.status_label = QLabel()
+        self.output_view = QPlainTextEdit()
+        self.output_view.setReadOnly(True)
+        self.output_view.setMaximumBlockCount(OUTPUT_VIEW_MAX_LINES)
+        self.output_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.output_view.setObjectName("outputView")
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        button_row = QHBoxLayout()
+        button_row.addWidget(self.status_label, 1)
+        button_row.addWidget(close_button)
+        layout.addWidget(self.run_input)
+        layout.addWidget(self.output_view, 1)
+        layout.addLayout(button_row)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(OUTPUT_POLL_MS)
+        self._timer.timeout.connect(self._poll)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._poll()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def show_latest(self, name=None):
+        self._refresh_runs()
+        for index in range(len(self._runs) - 1, -1, -1):
+            if name is None or self._runs[index].name == name:
+                self.run_input.setCurrentIndex(index)
+                break
+
+    def _refresh_runs(self):
+        runs = self._capture.runs()
+        if runs == self._runs:
+            return
+        current = self._run
+        self._runs = runs
+        self.run_input.blockSignals(True)
+        self.run_input.clear()
+        for run in runs:
+            self.run_input.addItem(f"{run.name} (pid {run.pid})")
+        if current in runs:
+            self.run_input.setCurrentIndex(runs.index(current))
+        self.run_input.blockSignals(False)
+        if current not in runs:
+            self._select_run(self.run_input.currentIndex())
+
+    def _select_run(self, index):
+        self._run = self._runs[index] if 0 <= index < len(self._runs) else None
+        self._offset = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.output_view.clear()
+        self._poll()
+
+    @traced("OutputViewerDialog._poll")
+    def _poll(self):
+        self._refresh_runs()
+        run = self._run
+        if run is None:
+            self.status_label.setText("No captured output yet.")
+            return
+        # Each poll copies at most one ring buffer's worth, so a chatty process
+        # can never make the viewer fall further and further behind.
+        data, self._offset, dropped = run.read_from(self._offset)
+        text = self._decoder.decode(data)
+        if dropped:
+            self._decoder.reset()
+            text = f"[... {dropped} bytes not shown ...]\n" + text
+        if text:
+            cursor = self.output_view.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+            self.output_view.ensureCursorVisible()
+        returncode = run.returncode
+        if returncode is None:
+            status = f"Running, {self._offset} bytes of output"
+        else:
+            status = f"Exited with code {returncode}, {self._offset} bytes of output"
+        if run.log_error:
+            status += f" \u2014 logging stopped: {run.log_error}"
+        elif run.log:
+            status += f" \u2014 log: {run.log.path}"
+        self.status_label.setText(status)
+
+
+class LaunchGroupSignals(QObject):
+    progress = Signal(str, str, str)
+    finished = Signal()
+
+
+class SyncSignals(QObject):
+    finished = Signal(object, object)
+    failed = Signal(str, bool)
+
+
+class LaunchErrorSignals(QObject):
+    failed = Signal(str)
+
+
+class HealthCheckWorker(QObject):
+    checked = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self._checker = TileHealthChecker()
+
+    @Slot(object)
+    def check(self, tiles):
+        self.checked.emit(self._checker.check(tiles))
+
+
+class TraceOverlay(QLabel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("traceOverlay")
+        self.setTextFormat(Qt.PlainText)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setVisible(False)
+        self._timer = QTimer(self)
+        self._timer.setInterval(TRACE_OVERLAY_INTERVAL_MS)
+        self._timer.timeout.connect(self.update_spans)
+
+    def toggle(self):
+        visible = not self.isVisible()
+        self.setVisible(visible)
+        if visible:
+            self.update_spans()
+            self._timer.start()
+        else:
+            self._timer.stop()
+
+    def update_spans(self):
+        lines = [
+            f"{span['duration_ms']:9.2f} ms  {span['name']}"
+            for span in tracing.recent_spans(TRACE_OVERLAY_SPANS)
+        ]
+        self.setText("\n".join(lines) or "No spans recorded yet.")
+
+
+class BoardTabBar(QTabBar):
+    def __init__(self, move_callback, parent=None):
+        super().__init__(parent)
+        self.setAcceptDrops(True)
+        self.setExpanding(False)
+        self.setContextMenuPolicy(Qt.CustomContextMenu)
+        self._move_callback = move_callback
+
+    def _drop_tab(self, event):
+        if not event.mimeData().hasFormat(TILE_MIME_TYPE):
+            return -1
+        pos = event.position().toPoint() if hasattr(event, "position") else event.pos()
+        index = self.tabAt(pos)
+        if index == self.currentIndex():
+            return -1
+        return index
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasFormat(TILE_MIME_TYPE):
+            event.acceptProposedAction()
+
+    def dragMoveEvent(self, event):
+        if self._drop_tab(event) >= 0:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dropEvent(self, event):
+        target_index = self._drop_tab(event)
+        if target_index < 0:
+            return
+        data = bytes(event.mimeData().data(TILE_MIME_TYPE)).decode("utf-8")
+        try:
+            source_index = int(data)
+        except ValueError:
+            return
+        self._move_callback(source_index, target_index)
+        event.acceptProposedAction()
 
 
 class TilesContainer(QWidget):
@@ -265,19 +956,62 @@ class TilesContainer(QWidget):
         self._reorder_callback = reorder_callback
         self.flow_layout = FlowLayout(self, margin=0, spacing=16)
         self.setLayout(self.flow_layout)
+        self._search_index = None
+        self._filter_terms = []
+        self._filter_matches = []
+
+    def reset_search(self):
+        self._search_index = None
+
+    def filter_tiles(self, terms):
+        if self._search_index is None:
+            self._search_index = [
+                (widget, widget.search_text) for widget in self.flow_layout.widgets()
+            ]
+            self._filter_terms = []
+        candidates = self._search_index
+        # Extending the previous query can only drop tiles, so typing further only
+        # re-checks what matched last time.
+        if self._filter_terms and all(
+            any(old in new for new in terms) for old in self._filter_terms
+        ):
+            candidates = self._filter_matches
+        # Same result as matches_search, one term at a time over a shrinking list.
+        matches = candidates
+        for term in terms:
+            matches = [entry for entry in matches if term in entry[1]]
+        self._filter_terms = terms
+        self._filter_matches = matches
+        self.flow_layout.set_included([widget for widget, _ in matches] if terms else None)
+        return len(matches)
+
+    def eventFilter(self, watched, event):
+        # Installed on the scroll viewport: growing it can reveal rows without moving or
+        # resizing this widget.
+        if event.type() == QEvent.Resize:
+            self.flow_layout.show_visible()
+        return False
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        self.flow_layout.show_visible()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.flow_layout.show_visible()
 
     def dragEnterEvent(self, event):
-        if event.mimeData().hasFormat("application/x-appboard-tile"):
+        if event.mimeData().hasFormat(TILE_MIME_TYPE):
             event.acceptProposedAction()
 
     def dragMoveEvent(self, event):
-        if event.mimeData().hasFormat("application/x-appboard-tile"):
+        if event.mimeData().hasFormat(TILE_MIME_TYPE):
             event.acceptProposedAction()
 
     def dropEvent(self, event):
-        if not event.mimeData().hasFormat("application/x-appboard-tile"):
+        if not event.mimeData().hasFormat(TILE_MIME_TYPE):
             return
-        data = bytes(event.mimeData().data("application/x-appboard-tile")).decode("utf-8")
+        data = bytes(event.mimeData().data(TILE_MIME_TYPE)).decode("utf-8")
         try:
             source_index = int(data)
         except ValueError:
@@ -288,25 +1022,59 @@ class TilesContainer(QWidget):
         event.acceptProposedAction()
 
     def _target_index(self, pos):
-        widgets = []
-        for i in range(self.flow_layout.count()):
-            item = self.flow_layout.itemAt(i)
-            if item and item.widget():
-                widgets.append(item.widget())
-        if not widgets:
-            return 0
+        # Layout indexes match tile indexes; hidden (filtered out) tiles keep their index
+        # but have stale geometry, so only visible tiles are drop targets.
         best_index = 0
         best_distance = None
-        for index, widget in enumerate(widgets):
-            center = widget.geometry().center()
-            distance = (pos - center).manhattanLength()
+        layout = self.flow_layout
+        for index in range(layout.count()):
+            widget = layout.itemAt(index).widget()
+            if widget is None or widget.isHidden():
+                continue
+            distance = (pos - widget.geometry().center()).manhattanLength()
             if best_distance is None or distance < best_distance:
                 best_distance = distance
                 best_index = index
         return best_index
 
 
+class TileButton(QPushButton):
+    def __init__(self, text, variant, parent=None):
+        super().__init__(text, parent)
+        self.variant = variant
+        self.setAttribute(Qt.WA_Hover)
+
+    def sizeHint(self):
+        metrics = self.fontMetrics()
+        padding_x, padding_y = BUTTON_PADDING
+        return QSize(
+            metrics.horizontalAdvance(self.text()) + 2 * padding_x + 2,
+            metrics.height() + 2 * padding_y + 2,
+        )
+
+    def minimumSizeHint(self):
+        return self.sizeHint()
+
+    def enterEvent(self, event):
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.update()
+        super().leaveEvent(event)
+
+    def paintEvent(self, event):
+        chrome = BUTTON_CHROME[self.variant]
+        state = "hover" if self.underMouse() or self.isDown() else "normal"
+        pixmap = _button_pixmap(self.variant, state, self.size(), self.devicePixelRatioF())
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+        painter.setPen(QColor(chrome["text"]))
+        painter.drawText(self.rect(), Qt.AlignCenter, self.text())
+
+
 class TileWidget(QFrame):
+    @traced("TileWidget.__init__")
     def __init__(
         self,
         tile,
@@ -326,6 +1094,7 @@ class TileWidget(QFrame):
         self.setObjectName("tile")
         self.setFixedSize(260, 160)
         self._drag_start_pos = None
+        self.search_text = tile_search_text(tile)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(8)
@@ -333,14 +1102,7 @@ class TileWidget(QFrame):
 
         top_row = QHBoxLayout()
         icon_label = QLabel()
-        icon = QIcon()
-        if tile.get("icon"):
-            icon = QIcon.fromTheme(tile.get("icon", ""))
-        if icon.isNull() and tile.get("path"):
-            icon = icon_provider.icon(QFileInfo(tile["path"]))
-        if icon.isNull():
-            icon = self.style().standardIcon(QStyle.SP_DesktopIcon)
-        icon_label.setPixmap(icon.pixmap(32, 32))
+        icon_label.setPixmap(self._resolve_icon(tile, icon_provider).pixmap(32, 32))
 
         name_label = QLabel(tile.get("name", "Untitled"))
         name_label.setObjectName("tileTitle")
@@ -355,23 +1117,50 @@ class TileWidget(QFrame):
         desc_label.setAlignment(Qt.AlignTop)
 
         button_row = QHBoxLayout()
-        launch_button = QPushButton("Open")
+        launch_button = TileButton("Open", "primary")
         launch_button.setObjectName("tileButton")
         launch_button.clicked.connect(lambda: self.launch_callback(self.tile))
-        edit_button = QPushButton("Edit")
+        edit_button = TileButton("Edit", "edit")
         edit_button.setObjectName("tileEditButton")
         edit_button.clicked.connect(lambda: self.edit_callback(self.tile))
-        remove_button = QPushButton("Remove")
+        remove_button = TileButton("Remove", "remove")
         remove_button.setObjectName("tileRemoveButton")
         remove_button.clicked.connect(lambda: self.remove_callback(self.tile))
         button_row.addWidget(launch_button)
         button_row.addWidget(edit_button)
         button_row.addWidget(remove_button)
+        self.launch_button = launch_button
 
         layout.addLayout(top_row)
         layout.addWidget(desc_label, 1)
         layout.addLayout(button_row)
 
+    @traced("TileWidget._resolve_icon")
+    def _resolve_icon(self, tile, icon_provider):
+        icon = QIcon()
+        if tile.get("icon"):
+            icon = QIcon.fromTheme(tile.get("icon", ""))
+        if icon.isNull() and tile.get("path"):
+            icon = icon_provider.icon(QFileInfo(tile["path"]))
+        if icon.isNull():
+            icon = self.style().standardIcon(QStyle.SP_DesktopIcon)
+        return icon
+
+    def set_health(self, status):
+        message = HEALTH_MESSAGES.get(status, "")
+        state = status if message else ""
+        if (self.property("health") or "") == state:
+            return
+        self.setProperty("health", state)
+        self.setToolTip(message)
+        self.launch_button.setToolTip(message)
+        self.update()
+
+    def paintEvent(self, event):
+        state = "unhealthy" if self.property("health") else "normal"
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, _tile_pixmap(state, self.size(), self.devicePixelRatioF()))
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self._drag_start_pos = event.pos()
@@ -386,7 +1175,7 @@ class TileWidget(QFrame):
         ):
             drag = QDrag(self)
             mime = QMimeData()
-            mime.setData("application/x-appboard-tile", str(self.index).encode("utf-8"))
+            mime.setData(TILE_MIME_TYPE, str(self.index).encode("utf-8"))
             drag.setMimeData(mime)
             drag.setPixmap(self.grab())
             drag.exec(Qt.MoveAction)
@@ -395,13 +1184,30 @@ class TileWidget(QFrame):
 
 
 class AppBoard(QWidget):
+    health_check_requested = Signal(object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_NAME)
         self.setMinimumSize(900, 600)
 
         self.icon_provider = QFileIconProvider()
-        self.tiles = []
+        self.store = TileStore(DATA_FILE)
+        self.board_data = {"boards": []}
+        self.active_index = 0
+        self._board_views = OrderedDict()
+        self.tile_health = {}
+        self._health_pending = False
+        self._health_stale = False
+        self._group_runs = []
+        self.launch_errors = LaunchErrorSignals()
+        self.launch_errors.failed.connect(self._show_queued_launch_error)
+        self.instance_limiter = InstanceLimiter(
+            lambda key, exc: self.launch_errors.failed.emit(str(exc))
+        )
+        self.output_capture = OutputCapture()
+        self.process_scanner = ProcessScanner()
+        self.output_viewer = None
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(24, 24, 24, 24)
@@ -412,6 +1218,19 @@ class AppBoard(QWidget):
         title.setObjectName("title")
         header.addWidget(title)
         header.addStretch()
+        self.filter_input = QLineEdit()
+        self.filter_input.setObjectName("filterInput")
+        self.filter_input.setPlaceholderText("Filter tiles (Ctrl+F)")
+        self.filter_input.setClearButtonEnabled(True)
+        self.filter_input.setMinimumWidth(220)
+        self.filter_input.textChanged.connect(self.apply_filter)
+        self.filter_input.returnPressed.connect(self.launch_top_match)
+        clear_filter = QShortcut(
+            QKeySequence(Qt.Key_Escape), self.filter_input, self.filter_input.clear
+        )
+        clear_filter.setContext(Qt.WidgetShortcut)
+        QShortcut(QKeySequence.Find, self, self._focus_filter)
+        header.addWidget(self.filter_input)
         add_button = QPushButton("Add Tile")
         add_button.setObjectName("primaryButton")
         add_button.clicked.connect(self.add_tile)
@@ -421,31 +1240,391 @@ class AppBoard(QWidget):
             add_system_button.setObjectName("secondaryButton")
             add_system_button.clicked.connect(self.add_system_tile)
             header.addWidget(add_system_button)
+        import_button = QPushButton("Import")
+        import_button.setObjectName("secondaryButton")
+        import_button.clicked.connect(self.import_tiles)
+        header.addWidget(import_button)
+        export_button = QPushButton("Export")
+        export_button.setObjectName("secondaryButton")
+        export_button.clicked.connect(self.export_tiles)
+        header.addWidget(export_button)
+        self.groups_menu = QMenu(self)
+        self.groups_menu.aboutToShow.connect(self._build_groups_menu)
+        groups_button = QPushButton("Groups")
+        groups_button.setObjectName("secondaryButton")
+        groups_button.setMenu(self.groups_menu)
+        header.addWidget(groups_button)
+        output_button = QPushButton("Output")
+        output_button.setObjectName("secondaryButton")
+        output_button.clicked.connect(lambda: self.show_output())
+        header.addWidget(output_button)
+        # Sync settings live beside the tiles file, so a board opened on another data file
+        # (such as the benchmark boards) never talks to the configured endpoint.
+        sync_config = load_sync_config(DATA_FILE.with_name(SYNC_CONFIG_FILE))
+        self.sync_client = None
+        self.sync_button = None
+        if sync_config:
+            self.sync_client = SyncClient.from_config(
+                sync_config, DATA_FILE.with_name(SYNC_STATE_FILE)
+            )
+            self.sync_button = QPushButton("Sync")
+            self.sync_button.setObjectName("secondaryButton")
+            self.sync_button.clicked.connect(lambda: self.sync_now(interactive=True))
+            header.addWidget(self.sync_button)
         main_layout.addLayout(header)
 
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setFrameShape(QFrame.NoFrame)
-
-        self.tiles_widget = TilesContainer(self.reorder_tiles)
-        self.flow_layout = self.tiles_widget.flow_layout
-
-        self.scroll_area.setWidget(self.tiles_widget)
-        main_layout.addWidget(self.scroll_area, 1)
-
-        self.empty_label = QLabel("No tiles yet. Add your first shortcut to get started.")
+        board_row = QHBoxLayout()
+        self.board_tabs = BoardTabBar(self.move_tile_to_board)
+        self.board_tabs.currentChanged.connect(self._on_board_tab_changed)
+        self.board_tabs.tabBarDoubleClicked.connect(self.rename_board)
+        self.board_tabs.customContextMenuRequested.connect(self._show_board_menu)
+        board_row.addWidget(self.board_tabs)
+        board_row.addStretch()
+        add_board_button = QPushButton("New Board")
+        add_board_button.setObjectName("secondaryButton")
+        add_board_button.clicked.connect(self.add_board)
+        board_row.addWidget(add_board_button)
+        main_layout.addLayout(board_row)
+
+        self.board_stack = QStackedWidget()
+        main_layout.addWidget(self.board_stack, 1)
+
+        self.empty_label = QLabel(EMPTY_BOARD_TEXT)
         self.empty_label.setAlignment(Qt.AlignCenter)
         self.empty_label.setObjectName("empty")
         main_layout.addWidget(self.empty_label)
 
+        self.trace_overlay = TraceOverlay()
+        main_layout.addWidget(self.trace_overlay)
+        if tracing.is_enabled():
+            QShortcut(QKeySequence("F12"), self, self.trace_overlay.toggle)
+
+        self._health_thread = QThread(self)
+        self._health_worker = HealthCheckWorker()
+        self._health_worker.moveToThread(self._health_thread)
+        self.health_check_requested.connect(self._health_worker.check)
+        self._health_worker.checked.connect(self._apply_health)
+        self._health_thread.finished.connect(self._health_worker.deleteLater)
+        self._health_thread.start()
+        self._health_timer = QTimer(self)
+        self._health_timer.setInterval(HEALTH_CHECK_INTERVAL_MS)
+        self._health_timer.timeout.connect(self.request_health_check)
+        self._health_timer.start()
+
+        self._file_watcher = QFileSystemWatcher(self)
+        self._file_watcher.fileChanged.connect(self._schedule_reload)
+        self._file_watcher.directoryChanged.connect(self._schedule_reload)
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(RELOAD_DEBOUNCE_MS)
+        self._reload_timer.timeout.connect(self.reload_tiles)
+
+        self._sync_running = False
+        self.sync_signals = SyncSignals()
+        self.sync_signals.finished.connect(self._sync_finished)
+        self.sync_signals.failed.connect(self._sync_failed)
+        self._sync_timer = QTimer(self)
+        self._sync_timer.timeout.connect(self.sync_now)
+        if self.sync_client:
+            self._sync_timer.setInterval(int(sync_config.get("interval", SYNC_INTERVAL) * 1000))
+            self._sync_timer.start()
+
         self.load_tiles()
-        self.refresh_tiles()
+        self._watch_data_file()
+        self.request_health_check()
+        self.sync_now()
+
+    @property
+    def boards(self):
+        return self.board_data["boards"]
+
+    @property
+    def active_board(self):
+        return self.boards[self.active_index]
+
+    @property
+    def groups(self):
+        groups = self.board_data.get("groups")
+        if not isinstance(groups, list):
+            groups = []
+            self.board_data["groups"] = groups
+        return groups
+
+    @property
+    def tiles(self):
+        return self.active_board["tiles"]
+
+    @tiles.setter
+    def tiles(self, tiles):
+        self.active_board["tiles"] = tiles
+
+    @property
+    def tiles_widget(self):
+        return self.board_stack.currentWidget().widget()
+
+    @property
+    def flow_layout(self):
+        return self.tiles_widget.flow_layout
+
+    def closeEvent(self, event):
+        self._health_timer.stop()
+        self._reload_timer.stop()
+        self._sync_timer.stop()
+        for runner, _ in self._group_runs:
+            runner.cancel()
+        self._health_thread.quit()
+        self._health_thread.wait()
+        super().closeEvent(event)
+
+    def request_health_check(self):
+        if self._health_pending:
+            self._health_stale = True
+            return
+        self._health_pending = True
+        self._health_stale = False
+        self.health_check_requested.emit(
+            [dict(tile) for board in self.boards for tile in board["tiles"]]
+        )
+
+    def _apply_health(self, results):
+        self._health_pending = False
+        self.tile_health = results
+        for view in self._board_views.values():
+            flow_layout = view.widget().flow_layout
+            for i in range(flow_layout.count()):
+                widget = flow_layout.itemAt(i).widget()
+                if widget:
+                    widget.set_health(results.get(tile_key(widget.tile)))
+        if self._health_stale:
+            self.request_health_check()
 
     def load_tiles(self):
-        self.tiles = load_tiles_file(DATA_FILE)
+        self.board_data = self.store.load()
+        for name in list(self._board_views):
+            self._drop_board_view(name)
+        self.board_tabs.blockSignals(True)
+        while self.board_tabs.count():
+            self.board_tabs.removeTab(0)
+        for board in self.boards:
+            self.board_tabs.addTab(board["name"])
+        self.board_tabs.blockSignals(False)
+        index = board_index(self.boards, self.board_data.get("active_board"))
+        self.show_board(max(index, 0))
 
     def save_tiles(self):
-        save_tiles_file(DATA_FILE, self.tiles)
+        try:
+            data = self.store.save(self.board_data)
+        except OSError as exc:
+            QMessageBox.critical(self, "Save failed", str(exc))
+            return
+        if data is not self.board_data:
+            self.apply_board_data(data)
+        self._watch_data_file()
+        self.request_health_check()
+
+    def _watch_data_file(self):
+        paths = [str(DATA_FILE.parent)]
+        if DATA_FILE.exists():
+            paths.append(str(DATA_FILE))
+        watched = self._file_watcher.files() + self._file_watcher.directories()
+        missing = [path for path in paths if path not in watched]
+        if missing:
+            self._file_watcher.addPaths(missing)
+
+    def _schedule_reload(self, _path=None):
+        self._reload_timer.start()
+
+    def reload_tiles(self):
+        data = self.store.reload(self.board_data)
+        self._watch_data_file()
+        if data is None:
+            return
+        self.apply_board_data(data)
+        self.request_health_check()
+
+    def sync_now(self, interactive=False):
+        if self.sync_client is None or self._sync_running:
+            return
+        self._sync_running = True
+        self.sync_button.setEnabled(False)
+        sent = copy.deepcopy(self.board_data)
+
+        def work():
+            try:
+                result = self.sync_client.sync(sent)
+            except (SyncError, OSError) as exc:
+                self.sync_signals.failed.emit(str(exc), interactive)
+                return
+            self.sync_signals.finished.emit(sent, result)
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _sync_finished(self, sent, result):
+        self._sync_running = False
+        self.sync_button.setEnabled(True)
+        self.sync_button.setToolTip("")
+        # Edits made while the sync was in flight are merged on top of its result.
+        data = merge_board_data(sent, self.board_data, result)
+        if data != self.board_data:
+            self.apply_board_data(data)
+            self.save_tiles()
+
+    def _sync_failed(self, message, interactive):
+        self._sync_running = False
+        self.sync_button.setEnabled(True)
+        self.sync_button.setToolTip(f"Last sync failed: {message}")
+        if interactive:
+            QMessageBox.warning(self, "Sync failed", message)
+
+    def apply_board_data(self, data):
+        previous = {board["name"]: board["tiles"] for board in self.boards}
+        active_name = self.active_board["name"]
+        self.board_data = data
+        names = [board["name"] for board in self.boards]
+        if names != [self.board_tabs.tabText(i) for i in range(self.board_tabs.count())]:
+            self.board_tabs.blockSignals(True)
+            while self.board_tabs.count():
+                self.board_tabs.removeTab(0)
+            for name in names:
+                self.board_tabs.addTab(name)
+            self.board_tabs.blockSignals(False)
+        for name in list(self._board_views):
+            index = board_index(self.boards, name)
+            if index < 0:
+                self._drop_board_view(name)
+            elif name != active_name and previous.get(name) != self.boards[index]["tiles"]:
+                self._drop_board_view(name)
+        index = board_index(self.boards, active_name)
+        if index < 0:
+            self.show_board(0)
+            return
+        self.show_board(index)
+        if previous.get(active_name) != self.tiles:
+            self.update_tiles()
+
+    def show_board(self, index):
+        self.active_index = index
+        name = self.active_board["name"]
+        self.board_data["active_board"] = name
+        if self.board_tabs.currentIndex() != index:
+            self.board_tabs.blockSignals(True)
+            self.board_tabs.setCurrentIndex(index)
+            self.board_tabs.blockSignals(False)
+        view = self._board_views.get(name)
+        if view is None:
+            view = self._create_board_view()
+            self._board_views[name] = view
+            self.board_stack.addWidget(view)
+            self.board_stack.setCurrentWidget(view)
+            self.refresh_tiles()
+        else:
+            self._board_views.move_to_end(name)
+            self.board_stack.setCurrentWidget(view)
+            self.apply_filter()
+        while len(self._board_views) > BOARD_CACHE_SIZE:
+            self._drop_board_view(next(iter(self._board_views)))
+
+    def _create_board_view(self):
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.NoFrame)
+        container = TilesContainer(self.reorder_tiles)
+        scroll_area.setWidget(container)
+        scroll_area.viewport().installEventFilter(container)
+        return scroll_area
+
+    def _drop_board_view(self, name):
+        view = self._board_views.pop(name, None)
+        if view is None:
+            return
+        self.board_stack.removeWidget(view)
+        view.deleteLater()
+
+    def _on_board_tab_changed(self, index):
+        if 0 <= index < len(self.boards):
+            self.show_board(index)
+
+    def _show_board_menu(self, pos):
+        index = self.board_tabs.tabAt(pos)
+        if index < 0:
+            return
+        menu = QMenu(self)
+        rename_action = menu.addAction("Rename")
+        delete_action = menu.addAction("Delete")
+        delete_action.setEnabled(len(self.boards) > 1)
+        chosen = menu.exec(self.board_tabs.mapToGlobal(pos))
+        if chosen is rename_action:
+            self.rename_board(index)
+        elif chosen is delete_action:
+            self.delete_board(index)
+
+    def _ask_board_name(self, title, current=""):
+        name, ok = QInputDialog.getText(self, title, "Board name", text=current)
+        name = name.strip()
+        if not ok or not name or name == current:
+            return None
+        return unique_board_name(name, {board["name"] for board in self.boards})
+
+    def add_board(self):
+        name = self._ask_board_name("New Board")
+        if not name:
+            return
+        self.boards.append({"name": name, "tiles": []})
+        self.board_tabs.addTab(name)
+        self.show_board(len(self.boards) - 1)
+        self.save_tiles()
+
+    def rename_board(self, index):
+        if not 0 <= index < len(self.boards):
+            return
+        board = self.boards[index]
+        name = self._ask_board_name("Rename Board", board["name"])
+        if not name:
+            return
+        view = self._board_views.pop(board["name"], None)
+        if view is not None:
+            self._board_views[name] = view
+        board["name"] = name
+        self.board_tabs.setTabText(index, name)
+        if index == self.active_index:
+            self.board_data["active_board"] = name
+        self.save_tiles()
+
+    def delete_board(self, index):
+        if len(self.boards) <= 1 or not 0 <= index < len(self.boards):
+            return
+        board = self.boards[index]
+        message = f"Delete board '{board['name']}'"
+        if board["tiles"]:
+            message += f" and its {len(board['tiles'])} tile(s)"
+        result = QMessageBox.question(self, "Delete board", message + "?")
+        if result != QMessageBox.Yes:
+            return
+        self._drop_board_view(board["name"])
+        del self.boards[index]
+        prune_group_members(self.groups, self.boards)
+        self.board_tabs.blockSignals(True)
+        self.board_tabs.removeTab(index)
+        self.board_tabs.blockSignals(False)
+        if self.active_index >= index:
+            self.active_index = max(self.active_index - 1, 0)
+        self.show_board(self.active_index)
+        self.save_tiles()
+
+    def move_tile_to_board(self, source_index, target_board_index):
+        if target_board_index == self.active_index:
+            return
+        if not 0 <= target_board_index < len(self.boards):
+            return
+        target = self.boards[target_board_index]
+        source_tiles, target_tiles = move_tile(self.tiles, source_index, target["tiles"])
+        if source_tiles is self.tiles:
+            return
+        self.tiles = source_tiles
+        target["tiles"] = target_tiles
+        self._drop_board_view(target["name"])
+        self.save_tiles()
+        self.refresh_tiles()
 
     def add_tile(self):
         dialog = AddTileDialog(self)
@@ -462,68 +1641,300 @@ class AppBoard(QWidget):
         dialog = DebianAppDialog(apps, self)
         if dialog.exec() != QDialog.Accepted:
             return
-        app = dialog.selected_app()
-        if not app:
-            return
-        self.tiles.append(
-            {
-                "kind": "desktop",
-                "name": app["name"],
-                "description": app.get("comment", ""),
-                "exec": app.get("exec", []),
-                "icon": app.get("icon", ""),
-                "desktop_file": app.get("path", ""),
-            }
+        self.add_tiles([desktop_app_to_tile(app) for app in dialog.selected_apps()])
+
+    def add_tiles(self, new_tiles):
+        self.tiles, added = merge_tiles(self.tiles, new_tiles)
+        if added:
+            self.save_tiles()
+            self.refresh_tiles()
+        return added
+
+    def import_tiles(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import tiles", "", "Tile files (*.json);;All files (*)"
         )
-        self.save_tiles()
-        self.refresh_tiles()
+        if not path:
+            return
+        imported = import_tiles_file(Path(path))
+        if not imported:
+            QMessageBox.information(self, "Nothing to import", "No tiles were found in that file.")
+            return
+        added = self.add_tiles(imported)
+        skipped = len(imported) - len(added)
+        message = f"Imported {len(added)} tile(s)."
+        if skipped:
+            message += f" Skipped {skipped} already on the board."
+        QMessageBox.information(self, "Import complete", message)
+
+    def export_tiles(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export tiles", "shortcuts.json", "Tile files (*.json)"
+        )
+        if not path:
+            return
+        try:
+            save_tiles_file(Path(path), self.tiles)
+        except OSError as exc:
+            QMessageBox.critical(self, "Export failed", str(exc))
 
+    @traced("AppBoard.refresh_tiles")
     def refresh_tiles(self):
+        self._discard_widgets(self._take_tile_widgets())
+
+        with _layout_batch(self.flow_layout):
+            for index, tile in enumerate(self.tiles):
+                self.flow_layout.addWidget(self._create_tile_widget(tile, index))
+            self.tiles_widget.reset_search()
+            self.apply_filter()
+
+    @traced("AppBoard.update_tiles")
+    def update_tiles(self):
+        reusable = {}
+        for widget in self._take_tile_widgets():
+            reusable.setdefault(_tile_signature(widget.tile), []).append(widget)
+
+        reused = []
+        for tile in self.tiles:
+            widgets = reusable.get(_tile_signature(tile))
+            reused.append(widgets.pop(0) if widgets else None)
+        self._discard_widgets([widget for widgets in reusable.values() for widget in widgets])
+
+        with _layout_batch(self.flow_layout):
+            for index, (tile, tile_widget) in enumerate(zip(self.tiles, reused)):
+                if tile_widget is None:
+                    tile_widget = self._create_tile_widget(tile, index)
+                else:
+                    tile_widget.tile = tile
+                    tile_widget.index = index
+                self.flow_layout.addWidget(tile_widget)
+            self.tiles_widget.reset_search()
+            self.apply_filter()
+
+    def _take_tile_widgets(self):
+        widgets = []
         while self.flow_layout.count():
-            item = self.flow_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
-
-        for index, tile in enumerate(self.tiles):
-            tile_widget = TileWidget(
-                tile,
-                index,
-                self.icon_provider,
-                self.launch_tile,
-                self.edit_tile,
-                self.remove_tile,
-            )
-            self.flow_layout.addWidget(tile_widget)
+            widget = self.flow_layout.takeAt(0).widget()
+            if widget:
+                widgets.append(widget)
+        return widgets
+
+    def _discard_widgets(self, widgets):
+        if not widgets:
+            return
+        graveyard = QWidget(self)
+        graveyard.hide()
+        for widget in widgets:
+            widget.hide()
+            widget.setParent(graveyard)
+        graveyard.deleteLater()
+
+    def _create_tile_widget(self, tile, index):
+        tile_widget = TileWidget(
+            tile,
+            index,
+            self.icon_provider,
+            self.launch_tile,
+            self.edit_tile,
+            self.remove_tile,
+        )
+        tile_widget.set_health(self.tile_health.get(tile_key(tile)))
+        return tile_widget
 
-        has_tiles = len(self.tiles) > 0
-        self.empty_label.setVisible(not has_tiles)
-        self.scroll_area.setVisible(has_tiles)
+    @traced("AppBoard.apply_filter")
+    def apply_filter(self, _text=None):
+        visible = self.tiles_widget.filter_tiles(search_terms(self.filter_input.text()))
+        self._update_empty_state(visible)
 
+    def launch_top_match(self):
+        terms = search_terms(self.filter_input.text())
+        if not terms:
+            return
+        for widget in self.flow_layout.widgets():
+            if matches_search(widget.search_text, terms):
+                self.launch_tile(widget.tile)
+                return
+
+    def _focus_filter(self):
+        self.filter_input.setFocus()
+        self.filter_input.selectAll()
+
+    def _update_empty_state(self, visible):
+        self.empty_label.setText(NO_MATCHES_TEXT if self.tiles else EMPTY_BOARD_TEXT)
+        self.empty_label.setVisible(not visible)
+        self.board_stack.setVisible(bool(visible))
+
+    @traced("AppBoard.launch_tile")
     def launch_tile(self, tile):
-        path = tile.get("path")
-        if tile.get("kind") == "desktop":
-            command = tile.get("exec", [])
-            if not command:
-                QMessageBox.warning(self, "Missing", "Launch command is missing for this app.")
+        if tile.get("kind") != "desktop" and not tile.get("path"):
+            return
+        try:
+            method, payload = resolve_tile_launch(tile, platform.system(), sys.executable)
+        except LaunchError as exc:
+            QMessageBox.warning(self, "Missing", str(exc))
+            return
+        if tile.get("single_instance"):
+            pids = self._running_instances(tile, method, payload)
+            if pids and self._focus_instance(tile, pids):
                 return
-            try:
-                subprocess.Popen(command)
-            except Exception as exc:
-                QMessageBox.critical(self, "Launch failed", str(exc))
+        try:
+            started = self._spawn(tile, method, payload)
+        except Exception as exc:
+            QMessageBox.critical(self, "Launch failed", str(exc))
             return
-        if not path:
+        if not started:
+            limit = tile["policy"]["max_instances"]
+            QMessageBox.information(
+                self,
+                "Launch queued",
+                f"'{tile.get('name', 'This tile')}' already has {limit} running instance(s). "
+                "It will start when one exits.",
+            )
+
+    @traced("AppBoard._running_instances")
+    def _running_instances(self, tile, method, payload):
+        pids = [process.pid for process in self.instance_limiter.running(tile_key(tile))]
+        if pids or method != "popen" or not self.process_scanner.available():
+            return pids
+        matcher = instance_matcher(payload)
+        return self.process_scanner.find(matcher) if matcher else []
+
+    def _focus_instance(self, tile, pids):
+        wm_class = tile.get("wm_class", "")
+        if not wm_class and tile.get("desktop_file"):
+            app = parse_desktop_file(tile["desktop_file"])
+            wm_class = app.get("wm_class", "") if app else ""
+        if focus_window(pids, wm_class):
+            return True
+        answer = QMessageBox.question(
+            self,
+            "Already running",
+            f"'{tile.get('name', 'This tile')}' is already running (PID {pids[0]}), "
+            "but its window could not be brought to the front.\n\nStart another copy?",
+        )
+        return answer != QMessageBox.Yes
+
+    def _spawn(self, tile, method, payload):
+        policy = dict(tile.get("policy") or {})
+        if platform.system() != "Linux":
+            policy = {key: value for key, value in policy.items() if key == "max_instances"}
+        return self.instance_limiter.launch(
+            tile_key(tile),
+            policy.get("max_instances", 0),
+            lambda: self._start_process(tile, method, payload, policy),
+        )
+
+    def _start_process(self, tile, method, payload, policy):
+        mode = tile.get("output", OUTPUT_INHERIT)
+        capture = mode != OUTPUT_INHERIT and method != "startfile"
+        process = start_launch(method, payload, policy, capture=capture)
+        if capture:
+            name = tile.get("name", "Untitled")
+            log_path = LOG_DIR / log_file_name(name) if mode == OUTPUT_LOG else None
+            self.output_capture.attach(name, process, log_path)
+        return process
+
+    def show_output(self, name=None):
+        if self.output_viewer is None:
+            self.output_viewer = OutputViewerDialog(self.output_capture, self)
+        self.output_viewer.show_latest(name)
+        self.output_viewer.show()
+        self.output_viewer.raise_()
+        self.output_viewer.activateWindow()
+
+    def _show_queued_launch_error(self, message):
+        QMessageBox.critical(self, "Launch failed", message)
+
+    def _build_groups_menu(self):
+        self.groups_menu.clear()
+        for group in self.groups:
+            action = self.groups_menu.addAction(f"Launch {group['name']}")
+            action.triggered.connect(lambda _=False, group=group: self.launch_group(group))
+        if self.groups:
+            self.groups_menu.addSeparator()
+        self.groups_menu.addAction("New Group...").triggered.connect(lambda: self.edit_group(None))
+        if self.groups:
+            edit_menu = self.groups_menu.addMenu("Edit")
+            delete_menu = self.groups_menu.addMenu("Delete")
+            for group in self.groups:
+                edit_action = edit_menu.addAction(group["name"])
+                edit_action.triggered.connect(lambda _=False, group=group: self.edit_group(group))
+                delete_action = delete_menu.addAction(group["name"])
+                delete_action.triggered.connect(lambda _=False, group=group: self.delete_group(group))
+
+    def edit_group(self, group):
+        tile_names = []
+        for board in self.boards:
+            for tile in board["tiles"]:
+                name = tile.get("name")
+                if name and name not in tile_names:
+                    tile_names.append(name)
+        dialog = LaunchGroupDialog(tile_names, group, self)
+        if dialog.exec() != QDialog.Accepted:
             return
-        path = os.path.expanduser(path)
-        if not os.path.exists(path):
-            QMessageBox.warning(self, "Missing", f"Path not found: {path}")
+        updated = dialog.values()
+        if group is None:
+            self.groups.append(updated)
+        else:
+            group.clear()
+            group.update(updated)
+        self.save_tiles()
+
+    def delete_group(self, group):
+        result = QMessageBox.question(self, "Delete group", f"Delete group '{group['name']}'?")
+        if result != QMessageBox.Yes:
             return
+        self.board_data["groups"] = [item for item in self.groups if item is not group]
+        self.save_tiles()
 
+    def launch_group(self, group):
         try:
-            self._open_target(path)
-        except Exception as exc:
-            QMessageBox.critical(self, "Launch failed", str(exc))
+            validate_launch_group(group)
+        except ValueError as exc:
+            QMessageBox.warning(self, "Invalid group", str(exc))
+            return
+        tiles = {}
+        for member in group["members"]:
+            tile = find_group_tile(self.boards, member)
+            if tile is not None:
+                tiles[member["tile"]] = dict(tile)
+        missing = [member["tile"] for member in group["members"] if member["tile"] not in tiles]
+        if missing:
+            QMessageBox.warning(self, "Missing", f"Tiles not found: {', '.join(missing)}")
+            return
+
+        platform_name = platform.system()
+
+        def launch(member):
+            tile = tiles[member["tile"]]
+            method, payload = resolve_tile_launch(tile, platform_name, sys.executable)
+            if tile.get("single_instance") and self._running_instances(tile, method, payload):
+                return True
+            return self._spawn(tile, method, payload)
+
+        dialog = LaunchProgressDialog(group, self)
+        signals = LaunchGroupSignals()
+        runner = LaunchGroupRunner(group["members"], launch, signals.progress.emit)
+        run = (runner, signals)
+        dialog.runner = runner
+        self._group_runs.append(run)
+
+        def finished():
+            dialog.finish()
+            if run in self._group_runs:
+                self._group_runs.remove(run)
+
+        signals.progress.connect(dialog.update_member)
+        signals.finished.connect(finished)
+        dialog.show()
+
+        def work():
+            try:
+                runner.run()
+            finally:
+                signals.finished.emit()
+
+        threading.Thread(target=work, daemon=True).start()
 
     def remove_tile(self, tile):
         name = tile.get("name", "this tile")
@@ -535,6 +1946,7 @@ class AppBoard(QWidget):
             self.tiles.remove(tile)
         except ValueError:
             return
+        prune_group_members(self.groups, self.boards)
         self.save_tiles()
         self.refresh_tiles()
 
@@ -544,6 +1956,9 @@ class AppBoard(QWidget):
                 "name": tile.get("name", ""),
                 "path": tile.get("desktop_file", ""),
                 "description": tile.get("description", ""),
+                "policy": tile.get("policy", {}),
+                "output": tile.get("output", OUTPUT_INHERIT),
+                "single_instance": tile.get("single_instance", False),
             }
             dialog = AddTileDialog(
                 self,
@@ -556,11 +1971,19 @@ class AppBoard(QWidget):
         if dialog.exec() != QDialog.Accepted:
             return
         updated = dialog.values()
+        if updated.get("name") and updated["name"] != tile.get("name"):
+            rename_group_members(self.groups, self.boards, tile, updated["name"])
         if tile.get("kind") == "desktop":
             tile["name"] = updated.get("name", tile.get("name", ""))
             tile["description"] = updated.get("description", tile.get("description", ""))
+            for key in OPTIONAL_TILE_KEYS:
+                if key in updated:
+                    tile[key] = updated[key]
         else:
             tile.update(updated)
+        for key in OPTIONAL_TILE_KEYS:
+            if key not in updated:
+                tile.pop(key, None)
         self.save_tiles()
         self.refresh_tiles()
 
@@ -572,18 +1995,67 @@ class AppBoard(QWidget):
         self.save_tiles()
         self.refresh_tiles()
 
-    def _open_target(self, path):
-        method, payload = determine_launch(
-            path,
-            platform.system(),
-            os.access(path, os.X_OK),
-            os.path.isfile(path),
-            sys.executable,
-        )
-        if method == "startfile":
-            os.startfile(payload)
+
+@contextmanager
+def _layout_batch(layout):
+    # Adding a child to a visible widget activates the parent layout right away;
+    # keep the layout disabled while adding many tiles and lay out once at the end.
+    enabled = layout.isEnabled()
+    layout.setEnabled(False)
+    try:
+        yield
+    finally:
+        layout.setEnabled(enabled)
+        layout.invalidate()
+
+
+def _cached_chrome(key, size, dpr, draw):
+    # Tile and button chrome only varies by size, scale and state, so it is drawn
+    # once into the shared pixmap cache and blitted on every repaint.
+    cache_key = f"appboard:{key}:{size.width()}x{size.height()}@{dpr:g}"
+    pixmap = QPixmapCache.find(cache_key)
+    if pixmap is None:
+        pixmap = QPixmap(round(size.width() * dpr), round(size.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        draw(painter, QRectF(0.5, 0.5, size.width() - 1, size.height() - 1))
+        painter.end()
+        QPixmapCache.insert(cache_key, pixmap)
+    return pixmap
+
+
+def _tile_pixmap(state, size, dpr):
+    top, bottom, border = TILE_CHROME[state]
+
+    def draw(painter, rect):
+        gradient = QLinearGradient(rect.topLeft(), rect.bottomRight())
+        gradient.setColorAt(0, QColor(top))
+        gradient.setColorAt(1, QColor(bottom))
+        painter.setPen(QPen(QColor(border), 1))
+        painter.setBrush(gradient)
+        painter.drawRoundedRect(rect, TILE_RADIUS, TILE_RADIUS)
+
+    return _cached_chrome(f"tile:{state}", size, dpr, draw)
+
+
+def _button_pixmap(variant, state, size, dpr):
+    chrome = BUTTON_CHROME[variant]
+
+    def draw(painter, rect):
+        if chrome["border"]:
+            painter.setPen(QPen(QColor(chrome["border"]), 1))
         else:
-            subprocess.Popen(payload)
+            painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor(chrome[state]))
+        painter.drawRoundedRect(rect, BUTTON_RADIUS, BUTTON_RADIUS)
+
+    return _cached_chrome(f"button:{variant}:{state}", size, dpr, draw)
+
+
+def _tile_signature(tile):
+    return json.dumps(tile, sort_keys=True)
 
 
 def apply_theme(app):
@@ -615,11 +2087,23 @@ def apply_theme(app):
         QScrollArea {
             border: none;
         }
-        QFrame#tile {
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 #ffffff, stop:1 #f1e7dc);
-            border: 1px solid #e0d6c9;
-            border-radius: 16px;
+        QLineEdit#filterInput {
+            background: #ffffff;
+            border: 1px solid #d2c9bc;
+            border-radius: 10px;
+            padding: 7px 10px;
+        }
+        QPlainTextEdit#outputView {
+            font-family: "DejaVu Sans Mono", "Menlo", "Consolas", monospace;
+            font-size: 12px;
+        }
+        QLabel#traceOverlay {
+            background: #1f1f1f;
+            color: #f5f2ec;
+            font-family: "DejaVu Sans Mono", "Menlo", "Consolas", monospace;
+            font-size: 12px;
+            border-radius: 8px;
+            padding: 8px;
         }
         QLabel#tileTitle {
             font-size: 16px;
@@ -628,35 +2112,6 @@ def apply_theme(app):
         QLabel#tileDesc {
             color: #5c5a56;
         }
-        QPushButton#tileButton {
-            background: #1f1f1f;
-            color: #ffffff;
-            border-radius: 8px;
-            padding: 6px 12px;
-        }
-        QPushButton#tileButton:hover {
-            background: #3b3b3b;
-        }
-        QPushButton#tileRemoveButton {
-            background: #ffffff;
-            color: #1f1f1f;
-            border: 1px solid #d2c9bc;
-            border-radius: 8px;
-            padding: 6px 12px;
-        }
-        QPushButton#tileRemoveButton:hover {
-            background: #f0e8dd;
-        }
-        QPushButton#tileEditButton {
-            background: #ffffff;
-            color: #1f1f1f;
-            border: 1px solid #d2c9bc;
-            border-radius: 8px;
-            padding: 6px 12px;
-        }
-        QPushButton#tileEditButton:hover {
-            background: #f7f0e6;
-        }
         QPushButton#primaryButton {
             background: #b55a30;
             color: #ffffff;
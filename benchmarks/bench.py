@@ -0,0 +1,332 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from core import (  # noqa: E402
+    list_desktop_apps,
+    load_tiles_file,
+    parse_desktop_file,
+    reorder_tiles,
+    save_tiles_file,
+)
+
+DEFAULT_THRESHOLD = 0.25
+BENCHMARKS = []
+
+
+def benchmark(name, gui=False, repeat=None):
+    def register(func):
+        BENCHMARKS.append({"name": name, "func": func, "gui": gui, "repeat": repeat})
+        return func
+
+    return register
+
+
+def write_desktop_corpus(directory, count):
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (directory / f"app{i:05d}.desktop").write_text(
+            "[Desktop Entry]\n"
+            "Type=Application\n"
+            f"Name=Sample App {i}\n"
+            f"Exec=sample-app-{i} --flag %U\n"
+            f"Comment=Generated application number {i}\n"
+            f"Icon=sample-icon-{i % 50}\n",
+            encoding="utf-8",
+        )
+    return directory
+
+
+def make_tiles(count):
+    tiles = []
+    for i in range(count):
+        if i % 2:
+            tiles.append(
+                {
+                    "kind": "desktop",
+                    "name": f"Desktop App {i}",
+                    "description": f"Generated desktop tile {i}",
+                    "exec": [f"sample-app-{i}", "--flag"],
+                    "icon": "",
+                    "desktop_file": f"/usr/share/applications/app{i:05d}.desktop",
+                }
+            )
+        else:
+            tiles.append(
+                {
+                    "name": f"Script {i}",
+                    "path": f"/home/user/scripts/run{i}.py",
+                    "description": f"Generated script tile {i}",
+                }
+            )
+    return tiles
+
+
+def make_apps(count):
+    return [
+        {
+            "name": f"Sample App {i}",
+            "exec": [f"sample-app-{i}"],
+            "comment": f"Generated application number {i}",
+            "icon": "",
+            "path": f"/usr/share/applications/app{i:05d}.desktop",
+        }
+        for i in range(count)
+    ]
+
+
+def _desktop_parse_bench(count):
+    def setup(tmp):
+        files = sorted(write_desktop_corpus(tmp / "apps", count).glob("*.desktop"))
+        return lambda: [parse_desktop_file(path) for path in files]
+
+    return setup
+
+
+def _desktop_list_bench(count):
+    def setup(tmp):
+        directory = write_desktop_corpus(tmp / "apps", count)
+        return lambda: list_desktop_apps([directory])
+
+    return setup
+
+
+for _count in (100, 1000, 10000):
+    benchmark(f"core.parse_desktop_file[{_count}]")(_desktop_parse_bench(_count))
+    benchmark(f"core.list_desktop_apps[{_count}]")(_desktop_list_bench(_count))
+
+
+@benchmark("core.load_tiles_file[10000]")
+def bench_load_tiles(tmp):
+    path = tmp / "shortcuts.json"
+    save_tiles_file(path, make_tiles(10000))
+    return lambda: load_tiles_file(path)
+
+
+@benchmark("core.save_tiles_file[10000]")
+def bench_save_tiles(tmp):
+    path = tmp / "shortcuts.json"
+    tiles = make_tiles(10000)
+    return lambda: save_tiles_file(path, tiles)
+
+
+@benchmark("core.reorder_tiles[10000]")
+def bench_reorder_tiles(tmp):
+    tiles = make_tiles(10000)
+
+    def run():
+        for source, target in ((0, 9999), (9999, 0), (5000, 10), (10, 5000)):
+            reorder_tiles(tiles, source, target)
+
+    return run
+
+
+def _qt_app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PySide6.QtWidgets import QApplication
+
+    import app
+
+    qt_app = QApplication.instance() or QApplication([])
+    app.apply_theme(qt_app)
+    return qt_app, app
+
+
+def _board(tmp, tiles):
+    qt_app, app = _qt_app()
+    app.DATA_FILE = tmp / "shortcuts.json"
+    save_tiles_file(app.DATA_FILE, tiles)
+    board = app.AppBoard()
+    board.resize(1200, 800)
+    board.show()
+    qt_app.processEvents()
+    return qt_app, board
+
+
+@benchmark("gui.AppBoard.refresh_tiles[1000]", gui=True, repeat=3)
+def bench_refresh_tiles(tmp):
+    qt_app, board = _board(tmp, make_tiles(1000))
+
+    def run():
+        board.refresh_tiles()
+        qt_app.processEvents()
+
+    run.cleanup = board.close
+    return run
+
+
+@benchmark("gui.FlowLayout.relayout[1000]", gui=True)
+def bench_flow_layout(tmp):
+    from PySide6.QtCore import QRect
+
+    qt_app, board = _board(tmp, make_tiles(1000))
+    layout = board.flow_layout
+
+    def run():
+        for width in (800, 1000, 1200, 1600):
+            # Layouts are cached per width; measure computing them.
+            layout._clear_cache()
+            layout.setGeometry(QRect(0, 0, width, 0))
+
+    run.cleanup = board.close
+    return run
+
+
+@benchmark("gui.AppBoard.scroll_paint[1000]", gui=True)
+def bench_scroll_paint(tmp):
+    qt_app, board = _board(tmp, make_tiles(1000))
+    view = board.board_stack.currentWidget()
+    scroll_bar = view.verticalScrollBar()
+    steps = range(0, scroll_bar.maximum() + 1, max(1, scroll_bar.pageStep() // 2))
+
+    def run():
+        for value in steps:
+            scroll_bar.setValue(value)
+            view.viewport().repaint()
+
+    run.cleanup = board.close
+    return run
+
+
+@benchmark("gui.AppBoard.apply_filter[5000]", gui=True)
+def bench_board_filter(tmp):
+    qt_app, board = _board(tmp, make_tiles(5000))
+    queries = ("s", "sc", "script", "script 12", "desktop app 4", "")
+
+    def run():
+        for text in queries:
+            board.filter_input.setText(text)
+            qt_app.processEvents()
+
+    run.cleanup = board.close
+    return run
+
+
+@benchmark("gui.DebianAppDialog.filter[10000]", gui=True)
+def bench_dialog_filter(tmp):
+    _, app = _qt_app()
+    dialog = app.DebianAppDialog(make_apps(10000))
+
+    def run():
+        for text in ("sample", "app 12", "number 99", "zzz", ""):
+            dialog.filter_input.setText(text)
+
+    run.cleanup = dialog.close
+    return run
+
+
+@benchmark("gui.TilesContainer.target_index[1000]", gui=True)
+def bench_drop_target(tmp):
+    from PySide6.QtCore import QPoint
+
+    qt_app, board = _board(tmp, make_tiles(1000))
+    container = board.tiles_widget
+    points = [QPoint(x, y) for x in range(0, 1200, 150) for y in range(0, 30000, 1500)]
+
+    def run():
+        for point in points:
+            container._target_index(point)
+
+    run.cleanup = board.close
+    return run
+
+
+def run_benchmarks(name_filter="", include_gui=True, repeat=5):
+    results = {}
+    for bench in BENCHMARKS:
+        if name_filter and name_filter not in bench["name"]:
+            continue
+        if bench["gui"] and not include_gui:
+            continue
+        with tempfile.TemporaryDirectory() as tmp:
+            run = bench["func"](Path(tmp))
+            try:
+                timings = []
+                for _ in range(bench["repeat"] or repeat):
+                    start = time.perf_counter()
+                    run()
+                    timings.append(time.perf_counter() - start)
+            finally:
+                cleanup = getattr(run, "cleanup", None)
+                if cleanup:
+                    cleanup()
+        results[bench["name"]] = {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "repeat": len(timings),
+        }
+        median_ms = results[bench["name"]]["median"] * 1000
+        print(f"{bench['name']:<45} {median_ms:10.2f} ms", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD):
+    regressions = []
+    for name, result in current.get("results", {}).items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("median"):
+            continue
+        ratio = result["median"] / base["median"]
+        if ratio > 1 + threshold:
+            regressions.append(
+                {
+                    "name": name,
+                    "baseline": base["median"],
+                    "current": result["median"],
+                    "ratio": ratio,
+                }
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run AppBoard benchmarks.")
+    parser.add_argument("-o", "--output", help="Write JSON results to this file instead of stdout.")
+    parser.add_argument("-k", "--filter", default="", help="Only run benchmarks whose name contains this text.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark.")
+    parser.add_argument("--no-gui", action="store_true", help="Skip the offscreen Qt benchmarks.")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown as a fraction of the baseline median (default: %(default)s).",
+    )
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks(args.filter, not args.no_gui, args.repeat)
+    payload = json.dumps(current, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload, encoding="utf-8")
+    else:
+        print(payload)
+
+    if not args.compare:
+        return 0
+    baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+    regressions = compare_results(baseline, current, args.threshold)
+    for item in regressions:
+        print(
+            f"REGRESSION {item['name']}: {item['baseline'] * 1000:.2f} ms -> "
+            f"{item['current'] * 1000:.2f} ms ({item['ratio']:.2f}x)",
+            file=sys.stderr,
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+import os
+import re
+import selectors
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+OUTPUT_INHERIT = "inherit"
+OUTPUT_CAPTURE = "capture"
+OUTPUT_LOG = "log"
+CAPTURE_BUFFER_BYTES = 256 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+MAX_CAPTURED_RUNS = 20
+
+
+class RingBuffer:
+    def __init__(self, capacity):
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive.")
+        self.capacity = capacity
+        self.total = 0
+        self._data = bytearray(capacity)
+
+    def write(self, chunk):
+        size = len(chunk)
+        view = memoryview(chunk)[-self.capacity :]
+        start = (self.total + size - len(view)) % self.capacity
+        first = min(len(view), self.capacity - start)
+        self._data[start : start + first] = view[:first]
+        self._data[: len(view) - first] = view[first:]
+        self.total += size
+
+    def read_from(self, offset):
+        oldest = max(0, self.total - self.capacity)
+        dropped = max(0, oldest - offset)
+        offset = max(offset, oldest)
+        length = self.total - offset
+        start = offset % self.capacity
+        first = min(length, self.capacity - start)
+        data = bytes(self._data[start : start + first]) + bytes(self._data[: length - first])
+        return data, self.total, dropped
+
+    def getvalue(self):
+        return self.read_from(0)[0]
+
+
+class RotatingLog:
+    def __init__(self, path, max_bytes=LOG_MAX_BYTES, backups=LOG_BACKUPS):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.path, "ab")
+        self._size = self._handle.tell()
+
+    def write(self, chunk):
+        with self._lock:
+            view = memoryview(chunk)
+            while view:
+                if self._size >= self.max_bytes:
+                    self._rotate()
+                part = view[: self.max_bytes - self._size]
+                self._handle.write(part)
+                self._size += len(part)
+                view = view[len(part) :]
+            self._handle.flush()
+
+    def close(self):
+        with self._lock:
+            self._handle.close()
+
+    def _rotate(self):
+        self._handle.close()
+        for index in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{index}")
+            if older.exists():
+                os.replace(older, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backups:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        self._handle = open(self.path, "wb")
+        self._size = 0
+
+
+def log_file_name(name):
+    return (re.sub(r"[^A-Za-z0-9._-]+", "_", name).strip("._") or "tile") + ".log"
+
+
+class CapturedRun:
+    def __init__(self, name, process, buffer_size, log=None):
+        self.name = name
+        self.pid = process.pid
+        self.started = time.time()
+        self.closed = False
+        self._process = process
+        self._buffer = RingBuffer(buffer_size)
+        self.log = log
+        self.log_error = None
+        self._lock = threading.Lock()
+
+    @property
+    def returncode(self):
+        return self._process.poll()
+
+    def feed(self, chunk):
+        with self._lock:
+            self._buffer.write(chunk)
+        if self.log and self.log_error is None:
+            # A failing log (disk full, file removed) only stops logging for this run;
+            # the pipe must keep draining or the child blocks once it fills.
+            try:
+                self.log.write(chunk)
+            except OSError as exc:
+                self.log_error = exc
+
+    def read_from(self, offset):
+        with self._lock:
+            return self._buffer.read_from(offset)
+
+    def output(self):
+        with self._lock:
+            return self._buffer.getvalue()
+
+
+class OutputCapture:
+    def __init__(self, buffer_size=CAPTURE_BUFFER_BYTES, max_runs=MAX_CAPTURED_RUNS):
+        self.buffer_size = buffer_size
+        self._runs = deque(maxlen=max_runs)
+        self._logs = {}
+        self._pending = []
+        self._lock = threading.Lock()
+        self._selector = None
+        self._wake_write = None
+
+    def runs(self):
+        with self._lock:
+            return list(self._runs)
+
+    def attach(self, name, process, log_path=None):
+        # The child is already running, so a log that cannot be opened must not stop the
+        # pipe from being drained; the run is captured without a log instead.
+        log = error = None
+        if log_path:
+            try:
+                log = self._open_log(Path(log_path))
+            except OSError as exc:
+                error = exc
+        run = CapturedRun(name, process, self.buffer_size, log)
+        run.log_error = error
+        with self._lock:
+            self._runs.append(run)
+        if os.name == "posix":
+            os.set_blocking(process.stdout.fileno(), False)
+            self._watch(process.stdout, run)
+        else:
+            thread = threading.Thread(target=self._drain, args=(process.stdout, run), daemon=True)
+            thread.start()
+        return run
+
+    def _open_log(self, path):
+        with self._lock:
+            entry = self._logs.get(path)
+            if entry is None:
+                entry = self._logs[path] = [RotatingLog(path), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def _close(self, stream, run):
+        stream.close()
+        run.closed = True
+        if run.log is None:
+            return
+        with self._lock:
+            entry = self._logs[run.log.path]
+            entry[1] -= 1
+            if entry[1]:
+                return
+            del self._logs[run.log.path]
+        try:
+            entry[0].close()
+        except OSError:
+            pass
+
+    def _watch(self, stream, run):
+        # One selector thread services every captured pipe; new pipes are handed
+        # over through a wake-up pipe so the selector is only touched by its thread.
+        with self._lock:
+            self._pending.append((stream, run))
+            if self._selector is None:
+                self._selector = selectors.DefaultSelector()
+                wake_read, self._wake_write = os.pipe()
+                os.set_blocking(wake_read, False)
+                self._selector.register(wake_read, selectors.EVENT_READ)
+                threading.Thread(target=self._select_loop, daemon=True).start()
+        os.write(self._wake_write, b"\0")
+
+    def _select_loop(self):
+        while True:
+            for key, _ in self._selector.select():
+                if key.data is None:
+                    self._register_pending(key.fd)
+                    continue
+                stream, run = key.fileobj, key.data
+                try:
+                    chunk = os.read(key.fd, READ_CHUNK_BYTES)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    chunk = b""
+                if chunk:
+                    run.feed(chunk)
+                else:
+                    self._selector.unregister(stream)
+                    self._close(stream, run)
+
+    def _register_pending(self, wake_read):
+        try:
+            os.read(wake_read, 4096)
+        except BlockingIOError:
+            pass
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for stream, run in pending:
+            self._selector.register(stream, selectors.EVENT_READ, run)
+
+    def _drain(self, stream, run):
+        try:
+            while True:
+                chunk = os.read(stream.fileno(), READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                run.feed(chunk)
+        except OSError:
+            pass
+        self._close(stream, run)
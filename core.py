@@ -1,10 +1,22 @@
 import configparser
+import copy
+import hashlib
 import json
 import os
 import shlex
+import unicodedata
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
+from tracing import traced
+
+
+@traced("core.load_tiles_file")
 def load_tiles_file(path):
     if path.exists():
         try:
@@ -14,8 +26,244 @@ def load_tiles_file(path):
     return []
 
 
+@traced("core.save_tiles_file")
 def save_tiles_file(path, tiles):
-    path.write_text(json.dumps(tiles, indent=2), encoding="utf-8")
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(tiles, indent=2), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+DEFAULT_BOARD_NAME = "Main"
+
+
+def unique_board_name(name, existing):
+    candidate = name
+    suffix = 2
+    while candidate in existing:
+        candidate = f"{name} {suffix}"
+        suffix += 1
+    return candidate
+
+
+def normalize_board_data(data):
+    if isinstance(data, list):
+        data = {"boards": [{"name": DEFAULT_BOARD_NAME, "tiles": data}]}
+    elif not isinstance(data, dict):
+        data = {}
+    boards = []
+    names = set()
+    raw_boards = data.get("boards")
+    for board in raw_boards if isinstance(raw_boards, list) else []:
+        if not isinstance(board, dict):
+            continue
+        name = unique_board_name(str(board.get("name") or DEFAULT_BOARD_NAME), names)
+        tiles = board.get("tiles")
+        names.add(name)
+        boards.append({**board, "name": name, "tiles": tiles if isinstance(tiles, list) else []})
+    if not boards:
+        boards.append({"name": DEFAULT_BOARD_NAME, "tiles": []})
+    normalized = dict(data)
+    normalized["boards"] = boards
+    return normalized
+
+
+def load_board_data(path):
+    return normalize_board_data(load_tiles_file(path))
+
+
+def board_index(boards, name):
+    for index, board in enumerate(boards):
+        if board["name"] == name:
+            return index
+    return -1
+
+
+_MISSING = object()
+
+
+def _merge_value(base, local, remote):
+    if local == remote or remote == base:
+        return local
+    if local == base:
+        return remote
+    return local
+
+
+def _merge_field(merged, key, base, local, remote):
+    value = _merge_value(base.get(key, _MISSING), local.get(key, _MISSING), remote.get(key, _MISSING))
+    if value is not _MISSING:
+        merged[key] = value
+
+
+def _keyed_tiles(tiles):
+    keyed = {}
+    counts = {}
+    for tile in tiles:
+        if not isinstance(tile, dict):
+            continue
+        key = tile_key(tile)
+        occurrence = counts.get(key, 0)
+        counts[key] = occurrence + 1
+        keyed[(key, occurrence)] = tile
+    return keyed
+
+
+def _merge_keyed(base, local, remote, merge_item):
+    merged = {}
+    for key in list(local) + [key for key in remote if key not in local]:
+        base_item = base.get(key, _MISSING)
+        local_item = local.get(key, _MISSING)
+        remote_item = remote.get(key, _MISSING)
+        if local_item is _MISSING:
+            if base_item is _MISSING or remote_item != base_item:
+                merged[key] = remote_item
+        elif remote_item is _MISSING:
+            if base_item is _MISSING or local_item != base_item:
+                merged[key] = local_item
+        else:
+            if base_item is _MISSING:
+                base_item = {} if isinstance(local_item, dict) else None
+            merged[key] = merge_item(base_item, local_item, remote_item)
+
+    base_order = [key for key in base if key in local and key in remote]
+    local_order = [key for key in local if key in base and key in remote]
+    remote_order = [key for key in remote if key in base and key in local]
+    if local_order != base_order and remote_order == base_order:
+        primary, secondary = local, remote
+    else:
+        primary, secondary = remote, local
+    order = [key for key in primary if key in merged]
+    order += [key for key in secondary if key in merged and key not in primary]
+    return [merged[key] for key in order]
+
+
+def _merge_board(base, local, remote):
+    merged = {}
+    for key in list(local) + [key for key in remote if key not in local]:
+        if key == "tiles":
+            continue
+        _merge_field(merged, key, base, local, remote)
+    merged["tiles"] = _merge_keyed(
+        _keyed_tiles(base.get("tiles", [])),
+        _keyed_tiles(local.get("tiles", [])),
+        _keyed_tiles(remote.get("tiles", [])),
+        _merge_value,
+    )
+    return merged
+
+
+def merge_board_data(base, local, remote):
+    base = normalize_board_data(base)
+    local = normalize_board_data(local)
+    remote = normalize_board_data(remote)
+    merged = {}
+    for key in list(local) + [key for key in remote if key not in local]:
+        if key == "boards":
+            continue
+        _merge_field(merged, key, base, local, remote)
+    merged["boards"] = _merge_keyed(
+        {board["name"]: board for board in base["boards"]},
+        {board["name"]: board for board in local["boards"]},
+        {board["name"]: board for board in remote["boards"]},
+        _merge_board,
+    )
+    return normalize_board_data(merged)
+
+
+def file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def tiles_file_lock(path):
+    if fcntl is None:
+        yield
+        return
+    lock_path = path.with_name(f".{path.name}.lock")
+    with open(lock_path, "a", encoding="utf-8") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class TileStore:
+    def __init__(self, path):
+        self.path = path
+        self._base = normalize_board_data([])
+        self._signature = None
+        self._digest = None
+
+    @traced("core.TileStore.load")
+    def load(self):
+        data = self._read()
+        if data is None:
+            data = []
+        data = normalize_board_data(data)
+        self._base = copy.deepcopy(data)
+        return data
+
+    @traced("core.TileStore.save")
+    def save(self, data):
+        with tiles_file_lock(self.path):
+            if self._changed_on_disk():
+                remote = self._read()
+                if remote is not None:
+                    data = merge_board_data(self._base, data, remote)
+            save_tiles_file(self.path, data)
+            self._remember(self.path.read_bytes(), file_signature(self.path))
+        self._base = copy.deepcopy(data)
+        return data
+
+    @traced("core.TileStore.reload")
+    def reload(self, local):
+        if not self._changed_on_disk():
+            return None
+        remote = self._read()
+        if remote is None:
+            return None
+        merged = merge_board_data(self._base, local, remote)
+        self._base = normalize_board_data(copy.deepcopy(remote))
+        return merged
+
+    def _changed_on_disk(self):
+        signature = file_signature(self.path)
+        if signature == self._signature:
+            return False
+        if signature is None:
+            self._signature = None
+            self._digest = None
+            return False
+        try:
+            raw = self.path.read_bytes()
+        except OSError:
+            return False
+        changed = hashlib.sha256(raw).hexdigest() != self._digest
+        if not changed:
+            self._signature = signature
+        return changed
+
+    def _read(self):
+        signature = file_signature(self.path)
+        try:
+            raw = self.path.read_bytes()
+        except OSError:
+            return None
+        try:
+            data = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return None
+        self._remember(raw, signature)
+        return data
+
+    def _remember(self, raw, signature):
+        self._signature = signature
+        self._digest = hashlib.sha256(raw).hexdigest()
 
 
 def sanitize_exec(exec_line):
@@ -47,15 +295,19 @@ def parse_desktop_file(path):
         "exec": sanitize_exec(exec_line),
         "comment": entry.get("Comment", ""),
         "icon": entry.get("Icon", ""),
+        "try_exec": entry.get("TryExec", ""),
+        "wm_class": entry.get("StartupWMClass", ""),
         "path": str(path),
     }
 
 
-def list_desktop_apps():
-    paths = [
-        Path("/usr/share/applications"),
-        Path.home() / ".local" / "share" / "applications",
-    ]
+@traced("core.list_desktop_apps")
+def list_desktop_apps(paths=None):
+    if paths is None:
+        paths = [
+            Path("/usr/share/applications"),
+            Path.home() / ".local" / "share" / "applications",
+        ]
     apps = []
     for base in paths:
         if not base.exists():
@@ -68,6 +320,76 @@ def list_desktop_apps():
     return apps
 
 
+def desktop_app_to_tile(app):
+    return {
+        "kind": "desktop",
+        "name": app["name"],
+        "description": app.get("comment", ""),
+        "exec": app.get("exec", []),
+        "icon": app.get("icon", ""),
+        "try_exec": app.get("try_exec", ""),
+        "wm_class": app.get("wm_class", ""),
+        "desktop_file": app.get("path", ""),
+    }
+
+
+def tile_key(tile):
+    if tile.get("kind") == "desktop":
+        if tile.get("desktop_file"):
+            return ("desktop", tile["desktop_file"])
+        return ("exec", tuple(tile.get("exec", [])))
+    return ("path", os.path.expanduser(tile.get("path", "")))
+
+
+def merge_tiles(tiles, new_tiles):
+    seen = {tile_key(tile) for tile in tiles}
+    added = []
+    for tile in new_tiles:
+        key = tile_key(tile)
+        if key in seen:
+            continue
+        seen.add(key)
+        added.append(tile)
+    return list(tiles) + added, added
+
+
+def import_tiles_file(path):
+    data = load_tiles_file(path)
+    if isinstance(data, dict):
+        data = [tile for board in normalize_board_data(data)["boards"] for tile in board["tiles"]]
+    if not isinstance(data, list):
+        return []
+    return [
+        tile
+        for tile in data
+        if isinstance(tile, dict) and tile.get("name") and (tile.get("path") or tile.get("exec"))
+    ]
+
+
+def normalize_search_text(text):
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.split())
+
+
+def tile_search_text(tile):
+    parts = [
+        tile.get("name", ""),
+        tile.get("description", ""),
+        tile.get("path", ""),
+        " ".join(tile.get("exec", [])),
+    ]
+    return normalize_search_text(" ".join(part for part in parts if part))
+
+
+def search_terms(query):
+    return normalize_search_text(query).split()
+
+
+def matches_search(search_text, terms):
+    return all(term in search_text for term in terms)
+
+
 def reorder_tiles(tiles, source_index, target_index):
     if source_index < 0 or target_index < 0:
         return tiles
@@ -83,6 +405,14 @@ def reorder_tiles(tiles, source_index, target_index):
     return updated
 
 
+def move_tile(source_tiles, source_index, target_tiles):
+    if source_index < 0 or source_index >= len(source_tiles):
+        return source_tiles, target_tiles
+    updated_source = list(source_tiles)
+    tile = updated_source.pop(source_index)
+    return updated_source, list(target_tiles) + [tile]
+
+
 def _venv_python_for_dir(base_dir):
     candidates = [".venv", "venv", ".env", "env"]
     for name in candidates:
@@ -126,3 +456,118 @@ def determine_launch(path, platform_name, is_executable, is_file, python_executa
     if is_executable and is_file:
         return "popen", [path]
     return "popen", ["xdg-open", path]
+
+
+HEALTH_OK = "ok"
+HEALTH_MISSING = "missing"
+HEALTH_NOT_EXECUTABLE = "not_executable"
+
+
+def build_executable_index(path_env):
+    index = {}
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name in index:
+                    continue
+                try:
+                    if entry.is_file() and os.access(entry.path, os.X_OK):
+                        index[entry.name] = entry.path
+                except OSError:
+                    continue
+    return index
+
+
+def desktop_command_name(command):
+    parts = list(command)
+    if parts and os.path.basename(parts[0]) == "env":
+        parts = parts[1:]
+        while parts and (parts[0].startswith("-") or "=" in parts[0]):
+            parts = parts[1:]
+    return parts[0] if parts else ""
+
+
+class TileHealthChecker:
+    def __init__(self, path_env=None):
+        self._path_env = path_env
+        self._path_mtimes = None
+        self._executables = {}
+        self._dir_mtimes = {}
+        self._results = {}
+        self._try_exec = {}
+
+    @traced("core.TileHealthChecker.check")
+    def check(self, tiles):
+        self._refresh_executables()
+        previous = self._results
+        self._results = {}
+        dir_mtimes = {}
+        results = {}
+        for tile in tiles:
+            results[tile_key(tile)] = self._check_tile(tile, previous, dir_mtimes)
+        self._dir_mtimes = dir_mtimes
+        return results
+
+    def _refresh_executables(self):
+        path_env = self._path_env
+        if path_env is None:
+            path_env = os.environ.get("PATH", "")
+        mtimes = [(directory, _mtime(directory)) for directory in path_env.split(os.pathsep)]
+        if mtimes != self._path_mtimes:
+            self._executables = build_executable_index(path_env)
+            self._path_mtimes = mtimes
+
+    def _check_tile(self, tile, previous, dir_mtimes):
+        if tile.get("kind") == "desktop":
+            name = self._desktop_try_exec(tile) or desktop_command_name(tile.get("exec", []))
+            if not name:
+                return HEALTH_MISSING
+            if os.sep not in name:
+                return HEALTH_OK if name in self._executables else HEALTH_MISSING
+            return self._check_path(name, True, previous, dir_mtimes)
+        path = tile.get("path")
+        if not path:
+            return HEALTH_MISSING
+        return self._check_path(os.path.expanduser(path), False, previous, dir_mtimes)
+
+    def _desktop_try_exec(self, tile):
+        if "try_exec" in tile:
+            return tile["try_exec"]
+        desktop_file = tile.get("desktop_file")
+        if not desktop_file:
+            return ""
+        if desktop_file not in self._try_exec:
+            parsed = parse_desktop_file(desktop_file)
+            self._try_exec[desktop_file] = parsed.get("try_exec", "") if parsed else ""
+        return self._try_exec[desktop_file]
+
+    def _check_path(self, path, needs_exec, previous, dir_mtimes):
+        parent = os.path.dirname(path)
+        if parent not in dir_mtimes:
+            dir_mtimes[parent] = _mtime(parent)
+        cache_key = (path, needs_exec)
+        cached = previous.get(cache_key)
+        if cached is not None and self._dir_mtimes.get(parent, -1) == dir_mtimes[parent]:
+            self._results[cache_key] = cached
+            return cached
+        if not os.path.exists(path):
+            status = HEALTH_MISSING
+        elif needs_exec and not (os.path.isfile(path) and os.access(path, os.X_OK)):
+            status = HEALTH_NOT_EXECUTABLE
+        else:
+            status = HEALTH_OK
+        self._results[cache_key] = status
+        return status
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
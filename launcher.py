@@ -0,0 +1,611 @@
+import os
+import shutil
+import socket
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from core import desktop_command_name, determine_launch
+from tracing import traced
+
+GROUP_MAX_WORKERS = 4
+READY_TIMEOUT = 30.0
+READY_POLL_INTERVAL = 0.2
+
+STATUS_PENDING = "pending"
+STATUS_STARTING = "starting"
+STATUS_WAITING = "waiting"
+STATUS_READY = "ready"
+STATUS_QUEUED = "queued"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+
+IONICE_CLASSES = {"realtime": 1, "best-effort": 2, "idle": 3}
+HANDOFF_COMMANDS = {"open", "xdg-open", "gio", "kde-open", "gnome-open", "exo-open"}
+SCRIPT_INTERPRETERS = {
+    "python", "pypy", "bash", "sh", "dash", "zsh", "ksh", "fish",
+    "node", "perl", "ruby", "php", "lua", "powershell", "pwsh",
+}
+# Interpreter options that take the next argument as their value, and ones after which
+# no script follows (python -c/-m, perl -e, ...).
+INTERPRETER_VALUE_OPTIONS = {"-W", "-X", "-o", "-r", "--rcfile", "--init-file", "-ExecutionPolicy"}
+INTERPRETER_CODE_OPTIONS = {"-c", "-m", "-e", "-p", "-Command", "--eval", "--print"}
+FOCUS_TIMEOUT = 2.0
+CMDLINE_SETTLE_SECONDS = 5.0
+
+
+class LaunchError(Exception):
+    pass
+
+
+class LaunchQueued(LaunchError):
+    pass
+
+
+def resolve_tile_launch(tile, platform_name, python_executable):
+    if tile.get("kind") == "desktop":
+        command = tile.get("exec", [])
+        if not command:
+            raise LaunchError("Launch command is missing for this app.")
+        return "popen", list(command)
+    path = tile.get("path")
+    if not path:
+        raise LaunchError("No path is set for this tile.")
+    path = os.path.expanduser(path)
+    if not os.path.exists(path):
+        raise LaunchError(f"Path not found: {path}")
+    if tile.get("python") and path.lower().endswith(".py"):
+        return "popen", [os.path.expanduser(tile["python"]), path]
+    return determine_launch(
+        path,
+        platform_name,
+        os.access(path, os.X_OK),
+        os.path.isfile(path),
+        python_executable,
+    )
+
+
+@traced("launcher.start_launch")
+def start_launch(method, payload, policy=None, capture=False):
+    if method == "startfile":
+        os.startfile(payload)
+        return None
+    if policy:
+        payload = policy_command(policy, payload)
+    if not capture:
+        return subprocess.Popen(payload)
+    return subprocess.Popen(
+        payload,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+
+
+def parse_cpu_list(text):
+    cpus = set()
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        start, _, end = part.partition("-")
+        if not start.isdigit() or (end and not end.isdigit()):
+            raise ValueError(f"Invalid CPU list entry: '{part}'")
+        first, last = int(start), int(end or start)
+        if last < first:
+            raise ValueError(f"Invalid CPU range: '{part}'")
+        cpus.update(range(first, last + 1))
+    return sorted(cpus)
+
+
+def format_cpu_list(cpus):
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ",".join(str(first) if first == last else f"{first}-{last}" for first, last in ranges)
+
+
+def normalize_launch_policy(policy):
+    policy = policy or {}
+    normalized = {}
+    if policy.get("nice") is not None:
+        nice = int(policy["nice"])
+        if not -20 <= nice <= 19:
+            raise ValueError("Nice level must be between -20 and 19.")
+        normalized["nice"] = nice
+    if policy.get("ionice"):
+        if policy["ionice"] not in IONICE_CLASSES:
+            raise ValueError(f"Unknown I/O class: {policy['ionice']}")
+        normalized["ionice"] = policy["ionice"]
+        if policy["ionice"] != "idle" and policy.get("ionice_level") is not None:
+            level = int(policy["ionice_level"])
+            if not 0 <= level <= 7:
+                raise ValueError("I/O priority level must be between 0 and 7.")
+            normalized["ionice_level"] = level
+    if policy.get("cpus"):
+        normalized["cpus"] = sorted({int(cpu) for cpu in policy["cpus"]})
+    for key in ("max_memory_mb", "max_open_files", "max_instances"):
+        if policy.get(key):
+            value = int(policy[key])
+            if value < 0:
+                raise ValueError(f"{key} cannot be negative.")
+            normalized[key] = value
+    return normalized
+
+
+def policy_command(policy, command):
+    policy = normalize_launch_policy(policy)
+    if os.name != "posix" or not any(key != "max_instances" for key in policy):
+        return list(command)
+    _check_policy_permitted(policy)
+    # Each wrapper execs the next, so the launched program keeps the PID Popen reports.
+    # Applying these in a preexec_fn instead is unsafe while other threads are running.
+    wrappers = []
+    if "nice" in policy:
+        wrappers.append(["nice", "-n", str(policy["nice"] - os.nice(0)), "--"])
+    if "ionice" in policy:
+        wrapper = ["ionice", "-c", str(IONICE_CLASSES[policy["ionice"]])]
+        if "ionice_level" in policy:
+            wrapper += ["-n", str(policy["ionice_level"])]
+        wrappers.append(wrapper + ["--"])
+    if "cpus" in policy:
+        available = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+        missing = sorted(set(policy["cpus"]) - available) if available else []
+        if missing:
+            raise OSError(f"CPUs not available: {format_cpu_list(missing)}")
+        wrappers.append(["taskset", "-c", format_cpu_list(policy["cpus"])])
+    limits = []
+    if "max_memory_mb" in policy:
+        limits.append(f"--as={policy['max_memory_mb'] * 1024 * 1024}")
+    if "max_open_files" in policy:
+        limits.append(f"--nofile={policy['max_open_files']}")
+    if limits:
+        wrappers.append(["prlimit", *limits, "--"])
+    wrapped = []
+    for wrapper in wrappers:
+        tool = shutil.which(wrapper[0])
+        if tool is None:
+            raise OSError(f"'{wrapper[0]}' is needed for this launch policy but was not found.")
+        wrapped += [tool, *wrapper[1:]]
+    return wrapped + list(command)
+
+
+def _check_policy_permitted(policy):
+    # A wrapper that cannot apply its setting exits before running the program (nice only
+    # warns), and Popen cannot tell; refuse what an unprivileged user may not do up front.
+    if os.geteuid() == 0:
+        return
+    if policy.get("ionice") == "realtime":
+        raise OSError("The real-time I/O class needs root.")
+    if resource is None:
+        return
+    current = os.nice(0)
+    if policy.get("nice", current) < current:
+        allowed = resource.getrlimit(resource.RLIMIT_NICE)[0]
+        if allowed != resource.RLIM_INFINITY and 20 - policy["nice"] > allowed:
+            raise OSError(f"Nice level {policy['nice']} is below the current {current}.")
+    limits = [
+        ("max_memory_mb", resource.RLIMIT_AS, 1024 * 1024, "Memory limit"),
+        ("max_open_files", resource.RLIMIT_NOFILE, 1, "Open-file limit"),
+    ]
+    for key, which, unit, label in limits:
+        hard = resource.getrlimit(which)[1]
+        if key in policy and hard != resource.RLIM_INFINITY and policy[key] * unit > hard:
+            raise OSError(f"{label} {policy[key]} is above the allowed maximum {hard // unit}.")
+
+
+class InstanceLimiter:
+    def __init__(self, on_error=None):
+        self._lock = threading.Lock()
+        self._running = {}
+        self._reserved = {}
+        self._queued = {}
+        self._on_error = on_error
+
+    def running(self, key):
+        with self._lock:
+            return list(self._running.get(key, []))
+
+    def queued(self, key):
+        with self._lock:
+            return len(self._queued.get(key, ()))
+
+    def launch(self, key, limit, start):
+        with self._lock:
+            active = len(self._running.get(key, [])) + self._reserved.get(key, 0)
+            if limit and active >= limit:
+                self._queued.setdefault(key, deque()).append(start)
+                return False
+            self._reserved[key] = self._reserved.get(key, 0) + 1
+        self._start(key, start)
+        return True
+
+    def _start(self, key, start):
+        process = None
+        try:
+            process = start()
+        finally:
+            with self._lock:
+                self._reserved[key] -= 1
+                if not self._reserved[key]:
+                    del self._reserved[key]
+                if process is not None:
+                    self._running.setdefault(key, []).append(process)
+        if process is not None:
+            threading.Thread(target=self._wait, args=(key, process), daemon=True).start()
+
+    def _wait(self, key, process):
+        process.wait()
+        with self._lock:
+            running = self._running.get(key, [])
+            if process in running:
+                running.remove(process)
+            if not running:
+                self._running.pop(key, None)
+            queue = self._queued.get(key)
+            start = queue.popleft() if queue else None
+            if queue is not None and not queue:
+                self._queued.pop(key, None)
+            if start is not None:
+                self._reserved[key] = self._reserved.get(key, 0) + 1
+        if start is None:
+            return
+        try:
+            self._start(key, start)
+        except Exception as exc:
+            if self._on_error:
+                self._on_error(key, exc)
+
+
+def instance_matcher(command):
+    command = list(command)
+    program = desktop_command_name(command)
+    if not program or os.path.basename(program) in HANDOFF_COMMANDS:
+        return None
+    args = command[command.index(program) + 1 :]
+    scripts = [arg for arg in args if os.path.isabs(arg) and os.path.isfile(arg)]
+    if scripts:
+        # Interpreter launches ([python, script.py], [bash, run.sh]) are identified by
+        # the script, since a venv or a different interpreter may be running it.
+        return _script_matcher(scripts[0])
+
+    resolved = _real_path(shutil.which(program) or program)
+    names = {os.path.basename(program), os.path.basename(resolved)}
+    wanted = set(args)
+    # A script started directly shows up as [interpreter, script].
+    run_directly = _script_matcher(resolved)
+
+    def matches(argv):
+        if os.path.basename(argv[0]) not in names and not run_directly(argv):
+            return False
+        return wanted.issubset(argv[1:])
+
+    return matches
+
+
+def _script_matcher(path):
+    real = _real_path(path)
+    names = {os.path.basename(path), os.path.basename(real)}
+
+    def matches(argv):
+        script = _script_argument(argv)
+        return (
+            script is not None
+            and os.path.isabs(script)
+            and os.path.basename(script) in names
+            and _real_path(script) == real
+        )
+
+    return matches
+
+
+def _script_argument(argv):
+    name = os.path.basename(argv[0]) if argv else ""
+    name = name[:-4] if name.lower().endswith(".exe") else name
+    if name.rstrip("0123456789.-") not in SCRIPT_INTERPRETERS:
+        return None
+    args = iter(argv[1:])
+    for arg in args:
+        if arg == "--":
+            return next(args, None)
+        if arg in INTERPRETER_CODE_OPTIONS:
+            return None
+        if arg in INTERPRETER_VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _real_path(path):
+    return os.path.realpath(os.path.expanduser(path))
+
+
+class ProcessScanner:
+    def __init__(self, proc_root="/proc"):
+        self.proc_root = proc_root
+        self._cmdlines = {}
+        self._first_seen = {}
+        self._lock = threading.Lock()
+
+    def available(self):
+        return os.path.isdir(self.proc_root)
+
+    def scan(self):
+        with self._lock:
+            return dict(self._scan())
+
+    @traced("launcher.ProcessScanner.scan")
+    def _scan(self):
+        # Only processes that appeared recently are read, so a scan costs one
+        # directory listing plus a read per new process. New processes are re-read
+        # for a few seconds because a fresh fork usually execs its real command.
+        try:
+            with os.scandir(self.proc_root) as entries:
+                pids = {int(entry.name) for entry in entries if entry.name.isdigit()}
+        except OSError:
+            return {}
+        now = time.monotonic()
+        for pid in self._cmdlines.keys() - pids:
+            del self._cmdlines[pid]
+            self._first_seen.pop(pid, None)
+        for pid in pids - self._cmdlines.keys():
+            self._first_seen[pid] = now
+        for pid, seen in list(self._first_seen.items()):
+            if now - seen > CMDLINE_SETTLE_SECONDS:
+                del self._first_seen[pid]
+            else:
+                self._cmdlines[pid] = self._read_cmdline(pid)
+        return self._cmdlines
+
+    def find(self, matcher):
+        own_pid = os.getpid()
+        found = []
+        with self._lock:
+            for pid, argv in list(self._scan().items()):
+                if not argv or pid == own_pid or not matcher(argv):
+                    continue
+                # Re-read matches so a reused PID or an exec since the last scan
+                # cannot produce a stale hit.
+                argv = self._cmdlines[pid] = self._read_cmdline(pid)
+                if argv and matcher(argv):
+                    found.append(pid)
+        return sorted(found)
+
+    def _read_cmdline(self, pid):
+        try:
+            with open(os.path.join(self.proc_root, str(pid), "cmdline"), "rb") as handle:
+                data = handle.read()
+        except OSError:
+            return ()
+        return tuple(os.fsdecode(arg) for arg in data.split(b"\0") if arg)
+
+
+def focus_window(pids, wm_class=""):
+    attempts = []
+    if wm_class and shutil.which("wmctrl"):
+        attempts.append(["wmctrl", "-x", "-a", wm_class])
+    if shutil.which("xdotool"):
+        searches = [["--class", wm_class]] if wm_class else []
+        searches += [["--pid", str(pid)] for pid in pids]
+        for search in searches:
+            attempts.append(["xdotool", "search", "--limit", "1", *search, "windowactivate"])
+    for command in attempts:
+        try:
+            result = subprocess.run(
+                command,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=FOCUS_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if result.returncode == 0:
+            return True
+    return False
+
+
+def parse_wait_for(text):
+    text = text.strip()
+    if not text:
+        return None
+    kind, _, value = text.partition(":")
+    kind = kind.strip().lower()
+    value = value.strip()
+    if kind == "file" and value:
+        return {"file": value}
+    if kind == "port":
+        host, _, port = value.rpartition(":")
+        if port.isdigit():
+            return {"port": int(port), "host": host or "127.0.0.1"}
+    raise ValueError(f"Use 'port:5432', 'port:host:5432' or 'file:/path', not '{text}'.")
+
+
+def format_wait_for(check):
+    if not check:
+        return ""
+    if "file" in check:
+        return f"file:{check['file']}"
+    host = check.get("host", "127.0.0.1")
+    if host == "127.0.0.1":
+        return f"port:{check['port']}"
+    return f"port:{host}:{check['port']}"
+
+
+def is_ready(check):
+    if "file" in check:
+        return os.path.exists(os.path.expanduser(check["file"]))
+    try:
+        with socket.create_connection((check.get("host", "127.0.0.1"), check["port"]), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+def validate_launch_group(group):
+    members = group.get("members", [])
+    names = [member.get("tile", "") for member in members]
+    if not all(names):
+        raise ValueError("Every group member needs a tile name.")
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Tiles listed more than once: {', '.join(duplicates)}")
+    known = set(names)
+    for member in members:
+        unknown = [name for name in member.get("after", []) if name not in known]
+        if unknown:
+            raise ValueError(f"'{member['tile']}' waits for unknown tiles: {', '.join(unknown)}")
+
+    remaining = {member["tile"]: set(member.get("after", [])) for member in members}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps & remaining.keys()]
+        if not ready:
+            raise ValueError(f"Circular ordering between: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+
+
+def find_group_tile(boards, member):
+    candidates = boards
+    if member.get("board"):
+        candidates = [board for board in boards if board["name"] == member["board"]] + boards
+    for board in candidates:
+        for tile in board["tiles"]:
+            if tile.get("name") == member["tile"]:
+                return tile
+    return None
+
+
+def rename_group_members(groups, boards, tile, name):
+    # Members refer to tiles by name; call before renaming tile so they keep following it.
+    for group in groups:
+        renamed = {
+            member["tile"]: name
+            for member in group.get("members", [])
+            if member["tile"] != name and find_group_tile(boards, member) is tile
+        }
+        if renamed:
+            _rewrite_group_members(group, renamed)
+
+
+def prune_group_members(groups, boards):
+    # Drops members whose tile is gone, along with orderings that wait for them.
+    for group in groups:
+        missing = {
+            member["tile"]
+            for member in group.get("members", [])
+            if find_group_tile(boards, member) is None
+        }
+        if missing:
+            group["members"] = [
+                member for member in group["members"] if member["tile"] not in missing
+            ]
+            _rewrite_group_members(group, dict.fromkeys(missing))
+
+
+def _rewrite_group_members(group, names):
+    # Maps old member names to new ones, or to None for members that were dropped.
+    for member in group["members"]:
+        member["tile"] = names.get(member["tile"], member["tile"])
+        if "after" in member:
+            after = [names.get(dep, dep) for dep in member["after"]]
+            member["after"] = [dep for dep in after if dep is not None]
+
+
+class LaunchGroupRunner:
+    def __init__(self, members, launch, progress=None, max_workers=GROUP_MAX_WORKERS):
+        self._members = {member["tile"]: member for member in members}
+        self._launch = launch
+        self._progress = progress or (lambda name, status, detail: None)
+        self._max_workers = max_workers
+        self._cancelled = threading.Event()
+        self.statuses = {name: STATUS_PENDING for name in self._members}
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @traced("launcher.LaunchGroupRunner.run")
+    def run(self):
+        for name in self._members:
+            self._progress(name, STATUS_PENDING, "")
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            running = {}
+            while True:
+                for name in self._startable():
+                    self._set(name, STATUS_STARTING, "")
+                    running[executor.submit(self._start_member, self._members[name])] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        self._set(name, STATUS_READY, "")
+                    elif isinstance(error, LaunchQueued):
+                        self._set(name, STATUS_QUEUED, str(error))
+                    else:
+                        self._set(name, STATUS_FAILED, str(error))
+                self._skip_blocked()
+        return dict(self.statuses)
+
+    def _startable(self):
+        if self._cancelled.is_set():
+            return []
+        return [
+            name
+            for name, member in self._members.items()
+            if self.statuses[name] == STATUS_PENDING
+            and all(self.statuses.get(dep) == STATUS_READY for dep in member.get("after", []))
+        ]
+
+    def _skip_blocked(self):
+        changed = True
+        while changed:
+            changed = False
+            for name, member in self._members.items():
+                if self.statuses[name] != STATUS_PENDING:
+                    continue
+                blocked = [
+                    dep
+                    for dep in member.get("after", [])
+                    if self.statuses.get(dep) in (STATUS_FAILED, STATUS_QUEUED, STATUS_SKIPPED)
+                ]
+                if blocked or self._cancelled.is_set():
+                    detail = f"waiting on {', '.join(blocked)}" if blocked else "cancelled"
+                    self._set(name, STATUS_SKIPPED, detail)
+                    changed = True
+
+    def _set(self, name, status, detail):
+        self.statuses[name] = status
+        self._progress(name, status, detail)
+
+    def _start_member(self, member):
+        # launch returns False when the instance limit queued the start for later.
+        if self._launch(member) is False:
+            raise LaunchQueued("starts when a running instance exits")
+        delay = float(member.get("delay", 0) or 0)
+        check = member.get("wait_for")
+        if not delay and not check:
+            return
+        self._set(member["tile"], STATUS_WAITING, format_wait_for(check) or f"{delay:g}s")
+        if delay and self._cancelled.wait(delay):
+            raise LaunchError("cancelled")
+        if not check:
+            return
+        deadline = time.monotonic() + float(member.get("timeout", READY_TIMEOUT))
+        while not is_ready(check):
+            if time.monotonic() >= deadline:
+                raise LaunchError(f"not ready after {member.get('timeout', READY_TIMEOUT):g}s")
+            if self._cancelled.wait(READY_POLL_INTERVAL):
+                raise LaunchError("cancelled")
@@ -0,0 +1,480 @@
+import argparse
+import copy
+import hashlib
+import json
+import os
+import sys
+import threading
+import urllib.request
+import uuid
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+from core import load_tiles_file, normalize_board_data, save_tiles_file, tile_key, tiles_file_lock
+from tracing import traced
+
+SYNC_CONFIG_FILE = "sync.json"
+SYNC_STATE_FILE = "sync_state.json"
+SYNC_LOG_FILE = "ops.jsonl"
+SYNC_TIMEOUT = 10
+SYNC_INTERVAL = 300
+DEFAULT_SYNC_PORT = 8765
+PATH_FIELDS = ("path", "desktop_file", "python")
+
+OP_ADD = "add"
+OP_EDIT = "edit"
+OP_REMOVE = "remove"
+OP_MOVE = "move"
+OPERATIONS = (OP_ADD, OP_EDIT, OP_REMOVE, OP_MOVE)
+
+
+class SyncError(Exception):
+    pass
+
+
+def rewrite_path(path, rules, to_local):
+    best = None
+    for canonical, local in rules:
+        source, target = (canonical, local) if to_local else (local, canonical)
+        source = source.rstrip("/\\")
+        if path == source or path.startswith((source + "/", source + "\\")):
+            if best is None or len(source) > len(best[0]):
+                best = (source, target.rstrip("/\\"))
+    if best is None:
+        return path
+    return best[1] + path[len(best[0]) :]
+
+
+def rewrite_tile(tile, rules, to_local):
+    tile = dict(tile)
+    if not rules:
+        return tile
+    for field in PATH_FIELDS:
+        if isinstance(tile.get(field), str):
+            tile[field] = rewrite_path(tile[field], rules, to_local)
+    if isinstance(tile.get("exec"), list):
+        tile["exec"] = [rewrite_path(arg, rules, to_local) for arg in tile["exec"]]
+    return tile
+
+
+def assign_tile_ids(data, rules=()):
+    # Untracked tiles get an id derived from their canonical identity, so hosts that
+    # start from copies of the same shortcuts.json agree on ids without talking.
+    # Existing ids are claimed first, so a new tile can never take over one of them.
+    seen = set()
+    untracked = []
+    for board in data["boards"]:
+        for tile in board["tiles"]:
+            if tile.get("id") and tile["id"] not in seen:
+                seen.add(tile["id"])
+            else:
+                untracked.append(tile)
+    occurrences = {}
+    for tile in untracked:
+        key = json.dumps(tile_key(rewrite_tile(tile, rules, to_local=False)))
+        occurrences[key] = occurrences.get(key, 0) + 1
+        tile_id = hashlib.sha1(f"{key}#{occurrences[key]}".encode("utf-8")).hexdigest()[:16]
+        while tile_id in seen:
+            tile_id = uuid.uuid4().hex[:16]
+        tile["id"] = tile_id
+        seen.add(tile_id)
+    return data
+
+
+def validate_operation(op):
+    if not isinstance(op, dict) or op.get("op") not in OPERATIONS:
+        raise ValueError("Unknown operation.")
+    if not isinstance(op.get("tile"), str) or not isinstance(op.get("host"), str):
+        raise ValueError("Operations need a tile id and a host.")
+    if not isinstance(op.get("clock"), int):
+        raise ValueError("Operations need an integer clock.")
+    if op["op"] in (OP_ADD, OP_EDIT) and not isinstance(op.get("fields"), dict):
+        raise ValueError(f"'{op['op']}' operations need fields.")
+    if op["op"] in (OP_ADD, OP_MOVE):
+        if not isinstance(op.get("board"), str) or not isinstance(op.get("pos"), (int, float)):
+            raise ValueError(f"'{op['op']}' operations need a board and a position.")
+
+
+def _stamp(op):
+    return [op["clock"], op["host"]]
+
+
+def _newer(stamp, current):
+    return current is None or tuple(stamp) > tuple(current)
+
+
+def apply_operation(tiles, op):
+    # Every tile field, the tile's placement and its removal are last-writer-wins
+    # registers ordered by (clock, host), so replicas that have seen the same
+    # operations agree no matter in which order they applied them.
+    stamp = _stamp(op)
+    entry = tiles.setdefault(op["tile"], {"fields": {}, "place": None, "removed": None})
+    if op["op"] == OP_REMOVE:
+        if _newer(stamp, entry["removed"]):
+            entry["removed"] = stamp
+        return
+    for name, value in op.get("fields", {}).items():
+        current = entry["fields"].get(name)
+        if current is None or _newer(stamp, current[1]):
+            entry["fields"][name] = [value, stamp]
+    if "board" in op and (entry["place"] is None or _newer(stamp, entry["place"][1])):
+        entry["place"] = [[op["board"], op["pos"]], stamp]
+
+
+def _is_alive(entry):
+    if entry["place"] is None:
+        return False
+    if entry["removed"] is None:
+        return True
+    stamps = [stamp for _, stamp in entry["fields"].values()] + [entry["place"][1]]
+    return tuple(max(stamps, key=tuple)) > tuple(entry["removed"])
+
+
+def _live_fields(entry):
+    return {name: value for name, (value, _) in entry["fields"].items() if value is not None}
+
+
+def materialize(tiles):
+    boards = {}
+    for tile_id, entry in tiles.items():
+        if not _is_alive(entry):
+            continue
+        (board, pos), _ = entry["place"]
+        tile = {"id": tile_id}
+        tile.update(_live_fields(entry))
+        boards.setdefault(board, []).append((pos, tile_id, tile))
+    return {board: [tile for _, _, tile in sorted(items)] for board, items in boards.items()}
+
+
+def _increasing_run(values):
+    # Indices of a longest strictly increasing subsequence of (index, value) pairs.
+    tails = []
+    tail_indices = []
+    previous = {}
+    for index, value in values:
+        slot = bisect_left(tails, value)
+        if slot == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[slot] = value
+            tail_indices[slot] = index
+        previous[index] = tail_indices[slot - 1] if slot else None
+    kept = set()
+    index = tail_indices[-1] if tail_indices else None
+    while index is not None:
+        kept.add(index)
+        index = previous[index]
+    return kept
+
+
+def _new_positions(board_name, tiles, current):
+    # Tiles that keep their relative order keep their position; everything else is
+    # placed between its nearest kept neighbours, so a move is one small operation.
+    old = []
+    for index, tile in enumerate(tiles):
+        entry = current.get(tile["id"])
+        if entry is not None and entry["place"][0][0] == board_name:
+            old.append((index, entry["place"][0][1]))
+    kept = _increasing_run(old)
+    old = dict(old)
+    positions = {}
+    index = 0
+    while index < len(tiles):
+        if index in kept:
+            index += 1
+            continue
+        end = index
+        while end < len(tiles) and end not in kept:
+            end += 1
+        count = end - index
+        low = old[index - 1] if index > 0 else None
+        high = old[end] if end < len(tiles) else None
+        if low is None:
+            low = (high if high is not None else count + 1) - count - 1
+        if high is None:
+            high = low + count + 1
+        for offset in range(count):
+            positions[tiles[index + offset]["id"]] = low + (high - low) * (offset + 1) / (count + 1)
+        index = end
+    return positions
+
+
+def diff_operations(tiles, data):
+    current = {tile_id: entry for tile_id, entry in tiles.items() if _is_alive(entry)}
+    ops = []
+    seen = set()
+    for board in data["boards"]:
+        positions = _new_positions(board["name"], board["tiles"], current)
+        for tile in board["tiles"]:
+            tile_id = tile["id"]
+            seen.add(tile_id)
+            fields = {name: value for name, value in tile.items() if name != "id"}
+            entry = current.get(tile_id)
+            if entry is None:
+                ops.append(
+                    {
+                        "op": OP_ADD,
+                        "tile": tile_id,
+                        "fields": fields,
+                        "board": board["name"],
+                        "pos": positions[tile_id],
+                    }
+                )
+                continue
+            old_fields = _live_fields(entry)
+            changed = {
+                name: value for name, value in fields.items() if old_fields.get(name) != value
+            }
+            changed.update({name: None for name in old_fields if name not in fields})
+            if changed:
+                ops.append({"op": OP_EDIT, "tile": tile_id, "fields": changed})
+            if tile_id in positions:
+                ops.append(
+                    {
+                        "op": OP_MOVE,
+                        "tile": tile_id,
+                        "board": board["name"],
+                        "pos": positions[tile_id],
+                    }
+                )
+    for tile_id in current.keys() - seen:
+        ops.append({"op": OP_REMOVE, "tile": tile_id})
+    return ops
+
+
+class DirectoryTransport:
+    # The log is append-only JSON lines; a version is the byte offset of the end of
+    # the last complete line, so a pull only reads what was appended since.
+    def __init__(self, directory):
+        self.path = Path(directory).expanduser() / SYNC_LOG_FILE
+        self._lock = threading.Lock()
+
+    def push(self, ops):
+        payload = "".join(json.dumps(op, sort_keys=True) + "\n" for op in ops).encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, tiles_file_lock(self.path):
+            with open(self.path, "ab") as handle:
+                handle.write(payload)
+                handle.flush()
+                os.fsync(handle.fileno())
+                return handle.tell()
+
+    def pull(self, since):
+        try:
+            with open(self.path, "rb") as handle:
+                handle.seek(0, os.SEEK_END)
+                if since > handle.tell():
+                    since = 0
+                handle.seek(since)
+                data = handle.read()
+        except FileNotFoundError:
+            return [], 0
+        end = data.rfind(b"\n") + 1
+        ops = [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+        return ops, since + end
+
+
+class HttpTransport:
+    def __init__(self, url, timeout=SYNC_TIMEOUT):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def push(self, ops):
+        return self._request(f"{self.url}/ops", {"ops": ops})["version"]
+
+    def pull(self, since):
+        body = self._request(f"{self.url}/ops?since={int(since)}")
+        return body["ops"], body["version"]
+
+    def _request(self, url, payload=None):
+        data = None if payload is None else json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(
+            url, data=data, headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = json.loads(response.read().decode("utf-8"))
+        except (OSError, ValueError) as exc:
+            raise SyncError(f"Sync server at {self.url} failed: {exc}") from exc
+        if not isinstance(body, dict) or "version" not in body:
+            raise SyncError(f"Sync server at {self.url} sent an unexpected reply.")
+        return body
+
+
+def transport_for(endpoint):
+    if urlparse(endpoint).scheme in ("http", "https"):
+        return HttpTransport(endpoint)
+    return DirectoryTransport(endpoint)
+
+
+def load_sync_config(path):
+    config = load_tiles_file(path)
+    if not isinstance(config, dict) or not config.get("endpoint"):
+        return None
+    return config
+
+
+class SyncClient:
+    def __init__(self, state_path, transport, rules=()):
+        self.state_path = state_path
+        self.transport = transport
+        self.rules = [tuple(rule) for rule in rules]
+
+    @classmethod
+    def from_config(cls, config, state_path):
+        return cls(state_path, transport_for(config["endpoint"]), config.get("path_map", []))
+
+    @traced("sync.SyncClient.sync")
+    def sync(self, data):
+        state = self._load_state()
+        data = assign_tile_ids(normalize_board_data(copy.deepcopy(data)), self.rules)
+        canonical = {
+            "boards": [
+                {
+                    "name": board["name"],
+                    "tiles": [
+                        rewrite_tile(tile, self.rules, to_local=False) for tile in board["tiles"]
+                    ],
+                }
+                for board in data["boards"]
+            ]
+        }
+        base = copy.deepcopy(state["tiles"])
+        # Remote operations are applied first so that local ones are stamped after every
+        # clock seen so far; a stale local copy must not outrank edits it never saw.
+        self._pull(state)
+        if base:
+            ops = diff_operations(base, canonical)
+        else:
+            # On the first sync the local board may be an old copy of the shared one, so
+            # tiles the log already knows keep their logged state and only new tiles are added.
+            ops = [
+                op
+                for op in diff_operations(state["tiles"], canonical)
+                if op["op"] == OP_ADD and op["tile"] not in state["tiles"]
+            ]
+        for op in ops:
+            state["clock"] += 1
+            op.update(clock=state["clock"], host=state["host"])
+            apply_operation(state["tiles"], op)
+            state["pending"].append(op)
+        # Pending operations are saved before pushing; a push that is repeated after
+        # a crash is harmless because applying an operation twice changes nothing.
+        self._save_state(state)
+        if state["pending"]:
+            self.transport.push(state["pending"])
+            state["pending"] = []
+            self._save_state(state)
+        return self._local_data(data, state)
+
+    def _pull(self, state):
+        try:
+            ops, version = self.transport.pull(state["version"])
+            for op in ops:
+                validate_operation(op)
+        except (KeyError, ValueError) as exc:
+            raise SyncError(f"Invalid operation log: {exc}") from exc
+        for op in ops:
+            state["clock"] = max(state["clock"], op["clock"])
+            apply_operation(state["tiles"], op)
+        state["version"] = version
+
+    def _local_data(self, data, state):
+        boards = materialize(state["tiles"])
+        local = {
+            name: [rewrite_tile(tile, self.rules, to_local=True) for tile in tiles]
+            for name, tiles in boards.items()
+        }
+        result = dict(data)
+        result["boards"] = []
+        for board in data["boards"]:
+            result["boards"].append(dict(board, tiles=local.pop(board["name"], [])))
+        for name in sorted(local):
+            result["boards"].append({"name": name, "tiles": local[name]})
+        return result
+
+    def _load_state(self):
+        state = load_tiles_file(self.state_path)
+        if not isinstance(state, dict) or not state.get("host"):
+            state = {"host": uuid.uuid4().hex, "clock": 0, "version": 0, "tiles": {}, "pending": []}
+        return state
+
+    def _save_state(self, state):
+        save_tiles_file(self.state_path, state)
+
+
+class SyncRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/ops":
+            self.send_error(404)
+            return
+        try:
+            since = int(parse_qs(url.query).get("since", ["0"])[0])
+        except ValueError:
+            self.send_error(400, "since must be an integer")
+            return
+        ops, version = self.server.transport.pull(since)
+        self._reply({"ops": ops, "version": version})
+
+    def do_POST(self):
+        if urlparse(self.path).path != "/ops":
+            self.send_error(404)
+            return
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            ops = body["ops"]
+            if not isinstance(ops, list):
+                raise ValueError("ops must be a list")
+            for op in ops:
+                validate_operation(op)
+        except (ValueError, KeyError, TypeError) as exc:
+            self.send_error(400, str(exc))
+            return
+        self._reply({"version": self.server.transport.push(ops)})
+
+    def _reply(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_sync_server(directory, host="127.0.0.1", port=DEFAULT_SYNC_PORT):
+    server = ThreadingHTTPServer((host, port), SyncRequestHandler)
+    server.transport = DirectoryTransport(directory)
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reference AppBoard sync server.")
+    parser.add_argument("directory", help="Directory that holds the shared operation log.")
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to listen on (default: %(default)s)."
+    )
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_SYNC_PORT, help="Port (default: %(default)s)."
+    )
+    args = parser.parse_args(argv)
+    server = make_sync_server(args.directory, args.host, args.port)
+    directory = Path(args.directory).resolve()
+    print(f"Serving {directory} on http://{args.host}:{server.server_port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+from benchmarks.bench import compare_results
+
+
+def _results(**medians):
+    return {"results": {name: {"median": value} for name, value in medians.items()}}
+
+
+def test_compare_results_flags_regressions_over_threshold():
+    baseline = _results(fast=1.0, slow=1.0)
+    current = _results(fast=1.2, slow=1.5)
+    regressions = compare_results(baseline, current, threshold=0.25)
+    assert [item["name"] for item in regressions] == ["slow"]
+    assert regressions[0]["ratio"] == 1.5
+
+
+def test_compare_results_ignores_benchmarks_missing_from_baseline():
+    assert compare_results(_results(), _results(new=5.0)) == []
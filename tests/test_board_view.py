@@ -0,0 +1,86 @@
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PySide6.QtWidgets")
+
+import app  # noqa: E402
+from core import save_tiles_file  # noqa: E402
+
+
+def make_tiles(count):
+    return [{"name": f"Tile {index}", "path": f"/tools/tile{index}"} for index in range(count)]
+
+
+@pytest.fixture
+def qt_app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def open_board(qt_app, tmp_path, monkeypatch):
+    errors = []
+    # Exceptions raised in Qt callbacks are only printed; collect them instead.
+    monkeypatch.setattr(sys, "excepthook", lambda *info: errors.append(info[1]))
+    monkeypatch.setattr(app, "DATA_FILE", tmp_path / "shortcuts.json")
+    monkeypatch.setattr(app, "LOG_DIR", tmp_path / "logs")
+    boards = []
+
+    def open_board(tiles):
+        save_tiles_file(app.DATA_FILE, tiles)
+        board = app.AppBoard()
+        board.resize(800, 600)
+        board.show()
+        qt_app.processEvents()
+        boards.append(board)
+        return board
+
+    yield open_board
+    for board in boards:
+        board.close()
+    assert errors == []
+
+
+def settle(qt_app):
+    # Layout requests posted while handling events need another pass to run.
+    for _ in range(3):
+        qt_app.processEvents()
+
+
+def shown_tiles(board):
+    return [widget.tile["name"] for widget in board.flow_layout.widgets() if widget.isVisible()]
+
+
+def test_removing_the_last_tile_shows_the_empty_board(qt_app, open_board, monkeypatch):
+    monkeypatch.setattr(
+        app.QMessageBox, "question", lambda *args: app.QMessageBox.StandardButton.Yes
+    )
+    board = open_board(make_tiles(1))
+    board.remove_tile(board.tiles[0])
+    qt_app.processEvents()
+    assert board.empty_label.isVisible()
+    assert not board.board_stack.isVisible()
+
+    board.add_tiles([{"name": "Fresh", "path": "/tools/fresh"}])
+    qt_app.processEvents()
+    assert not board.empty_label.isVisible()
+    assert shown_tiles(board) == ["Fresh"]
+
+
+def test_scrolling_before_a_pending_relayout(qt_app, open_board):
+    board = open_board(make_tiles(300))
+    view = board.board_stack.currentWidget()
+    board.refresh_tiles()
+    view.verticalScrollBar().setValue(view.verticalScrollBar().maximum())
+    view.viewport().repaint()
+    qt_app.processEvents()
+    shown = shown_tiles(board)
+    assert "Tile 299" in shown and "Tile 0" not in shown
+
+    board.tiles = board.tiles[:5]
+    board.update_tiles()
+    view.viewport().repaint()
+    settle(qt_app)
+    assert shown_tiles(board) == [f"Tile {index}" for index in range(5)]
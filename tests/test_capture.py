@@ -0,0 +1,119 @@
+import sys
+import time
+
+import capture as capture_module
+from capture import OutputCapture, RingBuffer, RotatingLog, log_file_name
+from launcher import start_launch
+
+
+def wait_until_closed(run, timeout=10):
+    deadline = time.monotonic() + timeout
+    while not run.closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert run.closed
+
+
+def test_ring_buffer_keeps_latest_bytes():
+    buffer = RingBuffer(8)
+    buffer.write(b"abcde")
+    assert buffer.getvalue() == b"abcde"
+    buffer.write(b"fghij")
+    assert buffer.getvalue() == b"cdefghij"
+    buffer.write(b"0123456789AB")
+    assert buffer.getvalue() == b"456789AB"
+    assert buffer.total == 22
+
+
+def test_ring_buffer_read_from_reports_dropped_bytes():
+    buffer = RingBuffer(4)
+    buffer.write(b"abc")
+    data, offset, dropped = buffer.read_from(0)
+    assert (data, offset, dropped) == (b"abc", 3, 0)
+    buffer.write(b"defgh")
+    data, offset, dropped = buffer.read_from(offset)
+    assert (data, offset, dropped) == (b"efgh", 8, 1)
+    assert buffer.read_from(offset) == (b"", 8, 0)
+
+
+def test_rotating_log_caps_file_sizes(tmp_path):
+    path = tmp_path / "logs" / "job.log"
+    log = RotatingLog(path, max_bytes=10, backups=2)
+    log.write(b"0123456789abcdefghij")
+    log.write(b"KLMNO")
+    log.close()
+    assert path.read_bytes() == b"KLMNO"
+    assert (tmp_path / "logs" / "job.log.1").read_bytes() == b"abcdefghij"
+    assert (tmp_path / "logs" / "job.log.2").read_bytes() == b"0123456789"
+    assert not (tmp_path / "logs" / "job.log.3").exists()
+
+
+def test_log_file_name_is_filesystem_safe():
+    assert log_file_name("Build / Deploy: prod") == "Build_Deploy_prod.log"
+    assert log_file_name("...") == "tile.log"
+
+
+def test_output_capture_bounds_chatty_process(tmp_path):
+    script = (
+        "import sys\n"
+        "for i in range(2000):\n"
+        "    sys.stdout.write(f'line {i:05d} ' + 'x' * 1000 + '\\n')\n"
+        "sys.stderr.write('done\\n')\n"
+    )
+    capture = OutputCapture(buffer_size=4096)
+    process = start_launch("popen", [sys.executable, "-c", script], capture=True)
+    run = capture.attach("chatty", process, tmp_path / "chatty.log")
+    wait_until_closed(run)
+    assert process.wait(timeout=10) == 0
+
+    output = run.output()
+    assert len(output) == 4096
+    assert output.endswith(b"line 01999 " + b"x" * 1000 + b"\ndone\n")
+    assert run.read_from(0)[2] > 0
+    assert (tmp_path / "chatty.log").stat().st_size == sum(
+        len(f"line {i:05d} ".encode()) + 1001 for i in range(2000)
+    ) + len(b"done\n")
+    assert capture.runs() == [run]
+
+
+def test_output_capture_keeps_recent_runs_only():
+    capture = OutputCapture(buffer_size=64, max_runs=2)
+    runs = []
+    for i in range(3):
+        process = start_launch("popen", [sys.executable, "-c", f"print({i})"], capture=True)
+        runs.append(capture.attach(f"run {i}", process))
+    for run in runs:
+        wait_until_closed(run)
+    assert capture.runs() == runs[1:]
+    assert [run.output().strip() for run in runs] == [b"0", b"1", b"2"]
+
+
+def test_output_capture_keeps_draining_after_log_errors(tmp_path, monkeypatch):
+    def fail(self, chunk):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(capture_module.RotatingLog, "write", fail)
+    capture = OutputCapture(buffer_size=1024 * 1024)
+    process = start_launch("popen", [sys.executable, "-c", "print('hi')"], capture=True)
+    logged = capture.attach("logged", process, tmp_path / "logged.log")
+    wait_until_closed(logged)
+    assert logged.output() == b"hi\n"
+    assert isinstance(logged.log_error, OSError)
+
+    script = "import sys; sys.stdout.write('x' * 200000)"
+    process = start_launch("popen", [sys.executable, "-c", script], capture=True)
+    chatty = capture.attach("chatty", process)
+    wait_until_closed(chatty)
+    assert process.wait(timeout=10) == 0
+    assert len(chatty.output()) == 200000
+
+
+def test_output_capture_runs_without_log_when_it_cannot_be_opened(tmp_path):
+    blocker = tmp_path / "logs"
+    blocker.write_text("not a directory")
+    capture = OutputCapture()
+    process = start_launch("popen", [sys.executable, "-c", "print('hi')"], capture=True)
+    run = capture.attach("broken", process, blocker / "broken.log")
+    wait_until_closed(run)
+    assert process.wait(timeout=10) == 0
+    assert run.log is None and isinstance(run.log_error, OSError)
+    assert run.output() == b"hi\n"
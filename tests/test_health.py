@@ -0,0 +1,93 @@
+import os
+
+from core import (
+    HEALTH_MISSING,
+    HEALTH_NOT_EXECUTABLE,
+    HEALTH_OK,
+    TileHealthChecker,
+    build_executable_index,
+    desktop_command_name,
+    tile_key,
+)
+
+
+def _make_executable(path):
+    path.write_text("#!/bin/sh\n", encoding="utf-8")
+    path.chmod(0o755)
+
+
+def test_build_executable_index_prefers_first_path_entry(tmp_path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    _make_executable(first / "tool")
+    _make_executable(second / "tool")
+    (second / "data.txt").write_text("", encoding="utf-8")
+    index = build_executable_index(os.pathsep.join([str(first), str(second), str(tmp_path / "nope")]))
+    assert index == {"tool": str(first / "tool")}
+
+
+def test_desktop_command_name_skips_env_assignments():
+    assert desktop_command_name(["env", "-u", "FOO=1", "app", "--x"]) == "app"
+    assert desktop_command_name(["/usr/bin/app"]) == "/usr/bin/app"
+    assert desktop_command_name([]) == ""
+
+
+def test_health_checker_reports_statuses(tmp_path):
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    _make_executable(bin_dir / "editor")
+    plain = tmp_path / "plain"
+    plain.write_text("", encoding="utf-8")
+    script = tmp_path / "run.py"
+    script.write_text("", encoding="utf-8")
+    tiles = [
+        {"name": "Script", "path": str(script)},
+        {"name": "Gone", "path": str(tmp_path / "gone.py")},
+        {"kind": "desktop", "name": "Editor", "exec": ["editor"]},
+        {"kind": "desktop", "name": "Ghost", "exec": ["ghost"]},
+        {"kind": "desktop", "name": "Plain", "exec": [str(plain)]},
+        {
+            "kind": "desktop",
+            "name": "Try",
+            "exec": ["editor"],
+            "try_exec": "ghost",
+            "desktop_file": "/x/try.desktop",
+        },
+    ]
+    results = TileHealthChecker(str(bin_dir)).check(tiles)
+    assert [results[tile_key(tile)] for tile in tiles] == [
+        HEALTH_OK,
+        HEALTH_MISSING,
+        HEALTH_OK,
+        HEALTH_MISSING,
+        HEALTH_NOT_EXECUTABLE,
+        HEALTH_MISSING,
+    ]
+
+
+def test_health_checker_reads_try_exec_from_desktop_file(tmp_path):
+    desktop = tmp_path / "app.desktop"
+    desktop.write_text(
+        "[Desktop Entry]\nType=Application\nName=App\nExec=sh\nTryExec=ghost\n",
+        encoding="utf-8",
+    )
+    tile = {"kind": "desktop", "name": "App", "exec": ["sh"], "desktop_file": str(desktop)}
+    results = TileHealthChecker(str(tmp_path)).check([tile])
+    assert results[tile_key(tile)] == HEALTH_MISSING
+
+
+def test_health_checker_rechecks_only_changed_directories(tmp_path):
+    target = tmp_path / "run.sh"
+    tile = {"name": "Run", "path": str(target)}
+    checker = TileHealthChecker("")
+    assert checker.check([tile])[tile_key(tile)] == HEALTH_MISSING
+
+    target.write_text("", encoding="utf-8")
+    os.utime(tmp_path, ns=(0, 0))
+    checker._dir_mtimes[str(tmp_path)] = 0
+    assert checker.check([tile])[tile_key(tile)] == HEALTH_MISSING
+
+    os.utime(tmp_path, ns=(10**9, 10**9))
+    assert checker.check([tile])[tile_key(tile)] == HEALTH_OK
@@ -0,0 +1,135 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import launcher
+from core import parse_desktop_file
+from launcher import ProcessScanner, focus_window, instance_matcher
+
+
+def write_process(root, pid, argv):
+    directory = root / str(pid)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "cmdline").write_bytes(b"\0".join(arg.encode() for arg in argv) + b"\0")
+
+
+def test_instance_matcher_identifies_scripts_by_path(tmp_path):
+    script = tmp_path / "serve.py"
+    script.write_text("")
+    matches = instance_matcher(["/usr/bin/python3", str(script)])
+    assert matches(("/home/me/.venv/bin/python", "-u", str(script), "--port", "8000"))
+    assert matches(("/bin/bash", str(tmp_path / "." / "serve.py")))
+    assert not matches(("/usr/bin/python3", str(tmp_path / "other.py")))
+    assert not matches(("/usr/bin/python3", "serve.py"))
+    assert matches(("python3.12", "-X", "dev", "--", str(script)))
+    assert not matches(("vim", str(script)))
+    assert not matches(("/usr/bin/tail", "-f", str(script)))
+    assert not matches(("/usr/bin/python3", "-m", "http.server", str(script)))
+    assert not matches(("/usr/bin/python3", str(tmp_path / "other.py"), str(script)))
+
+
+def test_instance_matcher_for_programs_requires_tile_arguments(tmp_path):
+    program = tmp_path / "editor"
+    program.write_text("#!/bin/sh\n")
+    program.chmod(0o755)
+    plain = instance_matcher(["env", "GDK_BACKEND=x11", str(program)])
+    assert plain(("editor", "--new-window", "notes.txt"))
+    assert plain(("/bin/sh", str(program)))
+    assert not plain(("less", str(program)))
+    assert not plain(("/usr/bin/editorial",))
+
+    private = instance_matcher([str(program), "--private"])
+    assert private(("/opt/editor/editor", "--private"))
+    assert not private(("/opt/editor/editor",))
+
+
+def test_instance_matcher_ignores_handoff_commands():
+    assert instance_matcher(["xdg-open", "/tmp/report.pdf"]) is None
+    assert instance_matcher([]) is None
+
+
+def test_process_scanner_reads_only_new_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(launcher, "CMDLINE_SETTLE_SECONDS", 0)
+    write_process(tmp_path, 10, ["/usr/bin/firefox"])
+    write_process(tmp_path, 11, ["bash"])
+    (tmp_path / "self").mkdir()
+    scanner = ProcessScanner(str(tmp_path))
+    assert scanner.scan() == {10: ("/usr/bin/firefox",), 11: ("bash",)}
+
+    write_process(tmp_path, 11, ["/usr/bin/firefox"])
+    write_process(tmp_path, 12, ["/usr/bin/firefox", "-contentproc"])
+    (tmp_path / "10" / "cmdline").unlink()
+    (tmp_path / "10").rmdir()
+    assert scanner.scan() == {11: ("bash",), 12: ("/usr/bin/firefox", "-contentproc")}
+
+
+def test_process_scanner_rereads_recent_processes_after_exec(tmp_path):
+    write_process(tmp_path, 30, ["/usr/bin/python3", "-m", "launcher_wrapper"])
+    scanner = ProcessScanner(str(tmp_path))
+    scanner.scan()
+    write_process(tmp_path, 30, ["/usr/bin/firefox"])
+    assert scanner.scan() == {30: ("/usr/bin/firefox",)}
+
+
+def test_process_scanner_find_rechecks_cached_matches(tmp_path):
+    write_process(tmp_path, 20, ["/usr/bin/firefox"])
+    write_process(tmp_path, 21, ["/usr/bin/firefox"])
+    scanner = ProcessScanner(str(tmp_path))
+    is_firefox = lambda argv: os.path.basename(argv[0]) == "firefox"  # noqa: E731
+    assert scanner.find(is_firefox) == [20, 21]
+
+    write_process(tmp_path, 21, ["/usr/bin/vim"])
+    assert scanner.find(is_firefox) == [20]
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+def test_process_scanner_finds_running_script(tmp_path):
+    script = tmp_path / "wait.py"
+    script.write_text("import sys\nsys.stdin.read()\n")
+    matcher = instance_matcher([sys.executable, str(script)])
+    scanner = ProcessScanner()
+    assert scanner.find(matcher) == []
+    process = subprocess.Popen([sys.executable, str(script)], stdin=subprocess.PIPE)
+    try:
+        deadline = time.monotonic() + 5
+        while not scanner.find(matcher) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert scanner.find(matcher) == [process.pid]
+    finally:
+        process.communicate(b"")
+    assert scanner.find(matcher) == []
+
+
+def test_focus_window_without_tools_reports_failure(monkeypatch):
+    monkeypatch.setattr(launcher.shutil, "which", lambda name: None)
+    assert focus_window([1234], "Firefox") is False
+
+
+def test_focus_window_tries_wm_class_then_pids(monkeypatch):
+    calls = []
+
+    def fake_run(command, **kwargs):
+        calls.append(command)
+        return subprocess.CompletedProcess(command, 0 if "--pid" in command else 1)
+
+    monkeypatch.setattr(launcher.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(launcher.subprocess, "run", fake_run)
+    assert focus_window([42], "Firefox") is True
+    assert calls == [
+        ["wmctrl", "-x", "-a", "Firefox"],
+        ["xdotool", "search", "--limit", "1", "--class", "Firefox", "windowactivate"],
+        ["xdotool", "search", "--limit", "1", "--pid", "42", "windowactivate"],
+    ]
+
+
+def test_parse_desktop_file_reads_startup_wm_class(tmp_path):
+    path = tmp_path / "firefox.desktop"
+    path.write_text(
+        "[Desktop Entry]\nType=Application\nName=Firefox\nExec=firefox %u\n"
+        "StartupWMClass=firefox-esr\n",
+        encoding="utf-8",
+    )
+    assert parse_desktop_file(path)["wm_class"] == "firefox-esr"
@@ -0,0 +1,168 @@
+import socket
+import threading
+
+import pytest
+
+from launcher import (
+    STATUS_FAILED,
+    STATUS_QUEUED,
+    STATUS_READY,
+    STATUS_SKIPPED,
+    LaunchError,
+    LaunchGroupRunner,
+    find_group_tile,
+    format_wait_for,
+    parse_wait_for,
+    prune_group_members,
+    rename_group_members,
+    resolve_tile_launch,
+    validate_launch_group,
+)
+
+
+def test_parse_and_format_wait_for():
+    assert parse_wait_for("") is None
+    assert parse_wait_for("port:5432") == {"port": 5432, "host": "127.0.0.1"}
+    assert parse_wait_for("port:db.local:5432") == {"port": 5432, "host": "db.local"}
+    assert parse_wait_for("file:/tmp/ready") == {"file": "/tmp/ready"}
+    assert format_wait_for({"port": 5432, "host": "127.0.0.1"}) == "port:5432"
+    assert format_wait_for({"port": 80, "host": "web"}) == "port:web:80"
+    with pytest.raises(ValueError):
+        parse_wait_for("socket:/tmp/x")
+
+
+def test_validate_launch_group_rejects_cycles_and_unknown_tiles():
+    validate_launch_group({"members": [{"tile": "A"}, {"tile": "B", "after": ["A"]}]})
+    with pytest.raises(ValueError, match="unknown"):
+        validate_launch_group({"members": [{"tile": "A", "after": ["Z"]}]})
+    with pytest.raises(ValueError, match="Circular"):
+        validate_launch_group(
+            {"members": [{"tile": "A", "after": ["B"]}, {"tile": "B", "after": ["A"]}]}
+        )
+
+
+def test_find_group_tile_prefers_named_board():
+    boards = [
+        {"name": "Main", "tiles": [{"name": "Shell", "path": "/bin/sh"}]},
+        {"name": "Work", "tiles": [{"name": "Shell", "path": "/bin/bash"}]},
+    ]
+    assert find_group_tile(boards, {"tile": "Shell"})["path"] == "/bin/sh"
+    assert find_group_tile(boards, {"tile": "Shell", "board": "Work"})["path"] == "/bin/bash"
+    assert find_group_tile(boards, {"tile": "Nope"}) is None
+
+
+def test_group_members_follow_renamed_and_removed_tiles():
+    server = {"name": "Server", "path": "/srv/run"}
+    other = {"name": "Server", "path": "/other/run"}
+    boards = [
+        {"name": "Main", "tiles": [server, {"name": "Client", "path": "/srv/client"}]},
+        {"name": "Spare", "tiles": [other]},
+    ]
+    groups = [
+        {
+            "name": "Stack",
+            "members": [
+                {"tile": "Server", "board": "Main"},
+                {"tile": "Client", "after": ["Server"]},
+            ],
+        },
+        {"name": "Spare", "members": [{"tile": "Server", "board": "Spare"}]},
+    ]
+    rename_group_members(groups, boards, server, "API")
+    server["name"] = "API"
+    assert groups[0]["members"] == [
+        {"tile": "API", "board": "Main"},
+        {"tile": "Client", "after": ["API"]},
+    ]
+    assert groups[1]["members"] == [{"tile": "Server", "board": "Spare"}]
+    assert find_group_tile(boards, groups[0]["members"][0]) is server
+
+    boards[0]["tiles"].remove(server)
+    prune_group_members(groups, boards)
+    assert groups[0]["members"] == [{"tile": "Client", "after": []}]
+    validate_launch_group(groups[0])
+    assert groups[1]["members"] == [{"tile": "Server", "board": "Spare"}]
+
+
+def test_resolve_tile_launch_reports_missing_targets(tmp_path):
+    with pytest.raises(LaunchError):
+        resolve_tile_launch({"kind": "desktop", "name": "X", "exec": []}, "Linux", "python")
+    with pytest.raises(LaunchError):
+        resolve_tile_launch({"name": "X", "path": str(tmp_path / "gone.sh")}, "Linux", "python")
+    script = tmp_path / "run.sh"
+    script.write_text("", encoding="utf-8")
+    assert resolve_tile_launch({"name": "X", "path": str(script)}, "Linux", "python") == (
+        "popen",
+        ["bash", str(script)],
+    )
+
+
+def test_runner_respects_ordering_and_skips_dependents_of_failures():
+    launched = []
+    lock = threading.Lock()
+
+    def launch(member):
+        with lock:
+            launched.append(member["tile"])
+        if member["tile"] == "Broken":
+            raise LaunchError("boom")
+
+    members = [
+        {"tile": "DB"},
+        {"tile": "API", "after": ["DB"]},
+        {"tile": "Broken"},
+        {"tile": "Worker", "after": ["Broken"]},
+    ]
+    events = []
+    statuses = LaunchGroupRunner(members, launch, lambda *event: events.append(event)).run()
+    assert statuses == {
+        "DB": STATUS_READY,
+        "API": STATUS_READY,
+        "Broken": STATUS_FAILED,
+        "Worker": STATUS_SKIPPED,
+    }
+    assert launched.index("DB") < launched.index("API")
+    assert "Worker" not in launched
+    assert ("Broken", STATUS_FAILED, "boom") in events
+
+
+def test_runner_waits_for_port_and_file(tmp_path):
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    port = server.getsockname()[1]
+    ready_file = tmp_path / "ready"
+    try:
+        members = [
+            {"tile": "Server", "wait_for": {"port": port}},
+            {"tile": "Writer"},
+            {"tile": "Reader", "after": ["Writer"], "wait_for": {"file": str(ready_file)}},
+        ]
+
+        def launch(member):
+            if member["tile"] == "Writer":
+                ready_file.write_text("", encoding="utf-8")
+
+        statuses = LaunchGroupRunner(members, launch).run()
+    finally:
+        server.close()
+    assert set(statuses.values()) == {STATUS_READY}
+
+
+def test_runner_times_out_readiness_checks(tmp_path):
+    members = [{"tile": "Slow", "wait_for": {"file": str(tmp_path / "never")}, "timeout": 0.3}]
+    statuses = LaunchGroupRunner(members, lambda member: None).run()
+    assert statuses == {"Slow": STATUS_FAILED}
+
+
+def test_runner_reports_queued_launches_and_skips_their_dependents():
+    members = [
+        {"tile": "Server", "wait_for": {"port": 1}},
+        {"tile": "Client", "after": ["Server"]},
+    ]
+    events = []
+    statuses = LaunchGroupRunner(
+        members, lambda member: False, lambda *event: events.append(event)
+    ).run()
+    assert statuses == {"Server": STATUS_QUEUED, "Client": STATUS_SKIPPED}
+    assert ("Client", STATUS_SKIPPED, "waiting on Server") in events
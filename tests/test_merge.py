@@ -0,0 +1,101 @@
+import json
+import os
+
+from core import TileStore, merge_board_data
+
+
+def _tile(name, path=None, **extra):
+    return {"name": name, "path": path or f"/bin/{name.lower()}", **extra}
+
+
+def _board(name, *tiles):
+    return {"name": name, "tiles": list(tiles)}
+
+
+def _names(data, board=0):
+    return [tile["name"] for tile in data["boards"][board]["tiles"]]
+
+
+def test_merge_keeps_additions_from_both_sides():
+    base = {"boards": [_board("Main", _tile("A"))]}
+    local = {"boards": [_board("Main", _tile("A"), _tile("Local"))]}
+    remote = {"boards": [_board("Main", _tile("A"), _tile("Remote"))]}
+    assert _names(merge_board_data(base, local, remote)) == ["A", "Remote", "Local"]
+
+
+def test_merge_applies_remote_edit_and_local_removal():
+    base = {"boards": [_board("Main", _tile("A"), _tile("B"))]}
+    local = {"boards": [_board("Main", _tile("A"))]}
+    remote = {"boards": [_board("Main", _tile("A", description="new"), _tile("B"))]}
+    merged = merge_board_data(base, local, remote)
+    assert merged["boards"][0]["tiles"] == [_tile("A", description="new")]
+
+
+def test_merge_prefers_local_on_conflicting_edits():
+    base = {"boards": [_board("Main", _tile("A"))]}
+    local = {"boards": [_board("Main", _tile("A", description="local"))]}
+    remote = {"boards": [_board("Main", _tile("A", description="remote"))]}
+    merged = merge_board_data(base, local, remote)
+    assert merged["boards"][0]["tiles"][0]["description"] == "local"
+
+
+def test_merge_keeps_local_reorder():
+    base = {"boards": [_board("Main", _tile("A"), _tile("B"), _tile("C"))]}
+    local = {"boards": [_board("Main", _tile("C"), _tile("A"), _tile("B"))]}
+    remote = {"boards": [_board("Main", _tile("A"), _tile("B"), _tile("C"), _tile("D"))]}
+    assert _names(merge_board_data(base, local, remote)) == ["C", "A", "B", "D"]
+
+
+def test_merge_boards_and_top_level_keys():
+    base = {"active_board": "Main", "boards": [_board("Main"), _board("Old")]}
+    local = {"active_board": "Main", "boards": [_board("Main"), _board("Old"), _board("Mine")]}
+    remote = {"active_board": "Theirs", "boards": [_board("Main"), _board("Theirs")]}
+    merged = merge_board_data(base, local, remote)
+    assert [board["name"] for board in merged["boards"]] == ["Main", "Theirs", "Mine"]
+    assert merged["active_board"] == "Theirs"
+
+
+def test_store_save_merges_external_changes(tmp_path):
+    path = tmp_path / "shortcuts.json"
+    path.write_text(json.dumps([_tile("A")]), encoding="utf-8")
+    store = TileStore(path)
+    local = store.load()
+
+    external = {"boards": [_board("Main", _tile("A"), _tile("External"))]}
+    path.write_text(json.dumps(external), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+
+    local["boards"][0]["tiles"].append(_tile("Local"))
+    saved = store.save(local)
+    assert _names(saved) == ["A", "External", "Local"]
+    assert _names(json.loads(path.read_text(encoding="utf-8"))) == ["A", "External", "Local"]
+
+
+def test_store_reload_detects_changes_only_once(tmp_path):
+    path = tmp_path / "shortcuts.json"
+    store = TileStore(path)
+    local = store.save(store.load())
+    assert store.reload(local) is None
+
+    path.write_text(json.dumps({"boards": [_board("Main", _tile("New"))]}), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    reloaded = store.reload(local)
+    assert _names(reloaded) == ["New"]
+    assert store.reload(reloaded) is None
+
+
+def test_store_reload_ignores_touch_without_content_change(tmp_path):
+    path = tmp_path / "shortcuts.json"
+    store = TileStore(path)
+    local = store.save(store.load())
+    os.utime(path, ns=(1, 1))
+    assert store.reload(local) is None
+
+
+def test_store_reload_skips_invalid_json(tmp_path):
+    path = tmp_path / "shortcuts.json"
+    store = TileStore(path)
+    local = store.save(store.load())
+    path.write_text("{partial", encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert store.reload(local) is None
@@ -0,0 +1,151 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import launcher
+from launcher import (
+    InstanceLimiter,
+    format_cpu_list,
+    normalize_launch_policy,
+    parse_cpu_list,
+    policy_command,
+    start_launch,
+)
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux launch policies")
+
+
+def test_parse_and_format_cpu_list():
+    assert parse_cpu_list("0-3, 6,2") == [0, 1, 2, 3, 6]
+    assert parse_cpu_list("") == []
+    assert format_cpu_list([6, 0, 1, 2, 3, 8]) == "0-3,6,8"
+    with pytest.raises(ValueError):
+        parse_cpu_list("3-1")
+    with pytest.raises(ValueError):
+        parse_cpu_list("a")
+
+
+def test_normalize_launch_policy_drops_defaults_and_validates():
+    assert normalize_launch_policy(None) == {}
+    assert normalize_launch_policy(
+        {"nice": 0, "ionice": "idle", "ionice_level": 3, "cpus": [2, 1, 2], "max_instances": 0}
+    ) == {"nice": 0, "ionice": "idle", "cpus": [1, 2]}
+    with pytest.raises(ValueError):
+        normalize_launch_policy({"nice": 25})
+    with pytest.raises(ValueError):
+        normalize_launch_policy({"ionice": "fast"})
+
+
+def test_policy_command_skips_instance_only_policies():
+    assert policy_command({"max_instances": 2}, ["tool", "-x"]) == ["tool", "-x"]
+
+
+@linux_only
+def test_policy_command_wraps_with_limit_tools(monkeypatch):
+    monkeypatch.setattr(launcher.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(launcher.os, "nice", lambda increment: 2)
+    monkeypatch.setattr(launcher.os, "geteuid", lambda: 0)
+    monkeypatch.setattr(launcher.os, "sched_getaffinity", lambda pid: {0, 1, 2, 3}, raising=False)
+    policy = {
+        "nice": 5,
+        "ionice": "best-effort",
+        "ionice_level": 6,
+        "cpus": [0, 1, 3],
+        "max_memory_mb": 512,
+        "max_open_files": 256,
+    }
+    assert policy_command(policy, ["-tool"]) == [
+        "/usr/bin/nice", "-n", "3", "--",
+        "/usr/bin/ionice", "-c", "2", "-n", "6", "--",
+        "/usr/bin/taskset", "-c", "0-1,3",
+        "/usr/bin/prlimit", "--as=536870912", "--nofile=256", "--",
+        "-tool",
+    ]
+
+    monkeypatch.setattr(launcher.shutil, "which", lambda name: None)
+    with pytest.raises(OSError, match="prlimit"):
+        policy_command({"max_open_files": 256}, ["tool"])
+
+
+@linux_only
+def test_policy_command_refuses_settings_that_need_privileges(monkeypatch):
+    resource = launcher.resource
+    limits = {
+        resource.RLIMIT_NICE: (0, 0),
+        resource.RLIMIT_AS: (resource.RLIM_INFINITY, resource.RLIM_INFINITY),
+        resource.RLIMIT_NOFILE: (1024, 4096),
+    }
+    monkeypatch.setattr(launcher.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(launcher.os, "geteuid", lambda: 1000)
+    monkeypatch.setattr(launcher.os, "nice", lambda increment: 0)
+    monkeypatch.setattr(resource, "getrlimit", limits.__getitem__)
+    for policy in ({"ionice": "realtime"}, {"nice": -5}, {"max_open_files": 8192}):
+        with pytest.raises(OSError):
+            policy_command(policy, ["tool"])
+    allowed = {"nice": 5, "ionice": "idle", "max_open_files": 4096, "max_memory_mb": 512}
+    assert policy_command(allowed, ["tool"])[-1] == "tool"
+
+
+@linux_only
+def test_start_launch_applies_policy_before_exec():
+    cpu = sorted(os.sched_getaffinity(0))[0]
+    nice = min(os.nice(0) + 3, 19)
+    script = (
+        "import json, os, resource;"
+        "print(json.dumps([os.nice(0), sorted(os.sched_getaffinity(0)),"
+        " resource.getrlimit(resource.RLIMIT_NOFILE)[0]]))"
+    )
+    policy = {"nice": nice, "cpus": [cpu], "max_open_files": 256}
+    process = subprocess.Popen(
+        policy_command(policy, [sys.executable, "-c", script]), stdout=subprocess.PIPE
+    )
+    output, _ = process.communicate(timeout=10)
+    assert json.loads(output) == [nice, [cpu], 256]
+
+
+@linux_only
+def test_start_launch_fails_when_policy_cannot_apply():
+    with pytest.raises(OSError):
+        start_launch("popen", [sys.executable, "-c", "pass"], {"cpus": [100000]})
+
+
+class FakeProcess:
+    def __init__(self, name):
+        self.name = name
+        self.done = threading.Event()
+
+    def wait(self):
+        self.done.wait(5)
+
+
+def test_instance_limiter_queues_over_limit():
+    started = []
+    all_started = threading.Event()
+
+    def starter(name):
+        def start():
+            process = FakeProcess(name)
+            started.append(process)
+            if len(started) == 3:
+                all_started.set()
+            return process
+
+        return start
+
+    limiter = InstanceLimiter()
+    assert limiter.launch("tile", 2, starter("a")) is True
+    assert limiter.launch("tile", 2, starter("b")) is True
+    assert limiter.launch("tile", 2, starter("c")) is False
+    assert limiter.queued("tile") == 1
+    assert [process.name for process in started] == ["a", "b"]
+
+    started[0].done.set()
+    assert all_started.wait(5)
+    assert [process.name for process in started] == ["a", "b", "c"]
+    assert limiter.queued("tile") == 0
+    for process in started:
+        process.done.set()
@@ -0,0 +1,21 @@
+from core import matches_search, normalize_search_text, search_terms, tile_search_text
+
+
+def test_normalize_search_text_folds_case_accents_and_spaces():
+    assert normalize_search_text("  Café   STRASSE\t") == "cafe strasse"
+    assert normalize_search_text("Straße") == "strasse"
+
+
+def test_tile_search_text_covers_name_description_path_and_exec():
+    script = {"name": "Backup", "description": "Nightly job", "path": "~/bin/backup.sh"}
+    desktop = {"kind": "desktop", "name": "Editor", "exec": ["gedit", "--new-window"]}
+    assert tile_search_text(script) == "backup nightly job ~/bin/backup.sh"
+    assert tile_search_text(desktop) == "editor gedit --new-window"
+
+
+def test_matches_search_requires_every_term():
+    text = tile_search_text({"name": "Résumé Builder", "path": "/opt/tools/resume.py"})
+    assert matches_search(text, search_terms("resume"))
+    assert matches_search(text, search_terms("BUILD tools"))
+    assert not matches_search(text, search_terms("builder latex"))
+    assert matches_search(text, search_terms("   "))
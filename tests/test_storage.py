@@ -1,4 +1,15 @@
-from core import load_tiles_file, save_tiles_file
+import json
+
+from core import (
+    DEFAULT_BOARD_NAME,
+    import_tiles_file,
+    load_board_data,
+    load_tiles_file,
+    merge_tiles,
+    move_tile,
+    normalize_board_data,
+    save_tiles_file,
+)
 
 
 def test_load_empty_when_missing(tmp_path):
@@ -23,3 +34,95 @@ def test_load_invalid_json_returns_empty(tmp_path):
     path = tmp_path / "shortcuts.json"
     path.write_text("{bad json}", encoding="utf-8")
     assert load_tiles_file(path) == []
+
+
+def test_merge_tiles_skips_duplicates():
+    existing = [
+        {"name": "Script", "path": "/home/user/run.py"},
+        {"kind": "desktop", "name": "Editor", "exec": ["editor"], "desktop_file": "/a/editor.desktop"},
+    ]
+    incoming = [
+        {"name": "Script again", "path": "/home/user/run.py"},
+        {"kind": "desktop", "name": "Editor", "exec": ["other"], "desktop_file": "/a/editor.desktop"},
+        {"kind": "desktop", "name": "Term", "exec": ["term"], "desktop_file": "/a/term.desktop"},
+        {"kind": "desktop", "name": "Term copy", "exec": ["term"], "desktop_file": "/a/term.desktop"},
+    ]
+    merged, added = merge_tiles(existing, incoming)
+    assert [tile["name"] for tile in added] == ["Term"]
+    assert merged == existing + added
+
+
+def test_merge_tiles_dedupes_desktop_by_exec_without_file():
+    existing = [{"kind": "desktop", "name": "Tool", "exec": ["tool", "--x"]}]
+    _, added = merge_tiles(existing, [{"kind": "desktop", "name": "Tool", "exec": ["tool", "--x"]}])
+    assert added == []
+
+
+def test_import_tiles_file_filters_invalid_entries(tmp_path):
+    path = tmp_path / "export.json"
+    valid = {"name": "Run", "path": "/tmp/run.sh"}
+    path.write_text(
+        json.dumps([valid, {"name": "No target"}, "junk", {"kind": "desktop", "name": "X", "exec": ["x"]}]),
+        encoding="utf-8",
+    )
+    assert import_tiles_file(path) == [valid, {"kind": "desktop", "name": "X", "exec": ["x"]}]
+
+
+def test_import_tiles_file_rejects_non_list(tmp_path):
+    path = tmp_path / "export.json"
+    path.write_text('{"name": "Run"}', encoding="utf-8")
+    assert import_tiles_file(path) == []
+
+
+def test_load_board_data_wraps_legacy_tile_list(tmp_path):
+    path = tmp_path / "shortcuts.json"
+    tiles = [{"name": "Run", "path": "/tmp/run.sh"}]
+    save_tiles_file(path, tiles)
+    assert load_board_data(path) == {"boards": [{"name": DEFAULT_BOARD_NAME, "tiles": tiles}]}
+
+
+def test_load_board_data_defaults_when_missing(tmp_path):
+    assert load_board_data(tmp_path / "missing.json") == {
+        "boards": [{"name": DEFAULT_BOARD_NAME, "tiles": []}]
+    }
+
+
+def test_normalize_board_data_fixes_names_and_tiles():
+    data = normalize_board_data(
+        {
+            "active_board": "Work",
+            "boards": [
+                {"name": "Work", "tiles": [{"name": "A", "path": "/a"}]},
+                {"name": "Work", "tiles": "bad"},
+                "junk",
+                {"tiles": []},
+            ],
+        }
+    )
+    assert data["active_board"] == "Work"
+    assert [board["name"] for board in data["boards"]] == ["Work", "Work 2", DEFAULT_BOARD_NAME]
+    assert data["boards"][1]["tiles"] == []
+
+
+def test_import_tiles_file_flattens_boards(tmp_path):
+    path = tmp_path / "boards.json"
+    first = {"name": "A", "path": "/a"}
+    second = {"name": "B", "path": "/b"}
+    boards = [{"name": "One", "tiles": [first]}, {"name": "Two", "tiles": [second]}]
+    save_tiles_file(path, {"boards": boards})
+    assert import_tiles_file(path) == [first, second]
+
+
+def test_move_tile_appends_to_target():
+    source = [{"name": "A"}, {"name": "B"}]
+    target = [{"name": "C"}]
+    new_source, new_target = move_tile(source, 0, target)
+    assert new_source == [{"name": "B"}]
+    assert new_target == [{"name": "C"}, {"name": "A"}]
+    assert source == [{"name": "A"}, {"name": "B"}]
+
+
+def test_move_tile_ignores_invalid_index():
+    source = [{"name": "A"}]
+    target = []
+    assert move_tile(source, 3, target) == (source, target)
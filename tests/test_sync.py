@@ -0,0 +1,281 @@
+import random
+import threading
+
+import pytest
+
+from core import normalize_board_data
+from sync import (
+    DirectoryTransport,
+    HttpTransport,
+    SyncClient,
+    SyncError,
+    apply_operation,
+    assign_tile_ids,
+    diff_operations,
+    make_sync_server,
+    materialize,
+    rewrite_path,
+    rewrite_tile,
+)
+
+ALICE_RULES = [["/srv/team", "/home/alice/team"]]
+BOB_RULES = [["/srv/team", "/Users/bob/work/team"]]
+
+
+def board(*tiles, name="Main"):
+    return {"name": name, "tiles": list(tiles)}
+
+
+def names(data, board_name="Main"):
+    for entry in data["boards"]:
+        if entry["name"] == board_name:
+            return [tile["name"] for tile in entry["tiles"]]
+    return None
+
+
+def bob_view(tile):
+    return rewrite_tile(rewrite_tile(tile, ALICE_RULES, to_local=False), BOB_RULES, to_local=True)
+
+
+def op(kind, tile, clock, host, **extra):
+    return dict({"op": kind, "tile": tile, "clock": clock, "host": host}, **extra)
+
+
+def test_rewrite_path_uses_longest_matching_prefix():
+    rules = [["/srv", "/mnt/srv"], ["/srv/team", "/home/alice/team/"]]
+    assert rewrite_path("/srv/team/run.py", rules, to_local=True) == "/home/alice/team/run.py"
+    assert rewrite_path("/srv/other.sh", rules, to_local=True) == "/mnt/srv/other.sh"
+    assert rewrite_path("/srv/teamwork.sh", rules, to_local=True) == "/mnt/srv/teamwork.sh"
+    assert rewrite_path("/home/alice/team/run.py", rules, to_local=False) == "/srv/team/run.py"
+    assert rewrite_path("/opt/tool", rules, to_local=True) == "/opt/tool"
+
+
+def test_rewrite_tile_touches_paths_interpreter_and_command():
+    tile = {
+        "name": "Serve",
+        "path": "/home/alice/team/serve.py",
+        "python": "/home/alice/team/.venv/bin/python",
+        "exec": ["/home/alice/team/bin/tool", "--flag"],
+    }
+    canonical = rewrite_tile(tile, ALICE_RULES, to_local=False)
+    assert canonical == {
+        "name": "Serve",
+        "path": "/srv/team/serve.py",
+        "python": "/srv/team/.venv/bin/python",
+        "exec": ["/srv/team/bin/tool", "--flag"],
+    }
+    local = rewrite_tile(canonical, BOB_RULES, to_local=True)
+    assert local["path"] == "/Users/bob/work/team/serve.py"
+    assert tile["path"] == "/home/alice/team/serve.py"
+
+
+def test_assign_tile_ids_agrees_across_hosts_and_fixes_duplicates():
+    alice = normalize_board_data([{"name": "Serve", "path": "/home/alice/team/serve.py"}])
+    bob = normalize_board_data([{"name": "Serve", "path": "/Users/bob/work/team/serve.py"}])
+    assign_tile_ids(alice, ALICE_RULES)
+    assign_tile_ids(bob, BOB_RULES)
+    assert alice["boards"][0]["tiles"][0]["id"] == bob["boards"][0]["tiles"][0]["id"]
+
+    data = normalize_board_data(
+        [{"name": "A", "path": "/a", "id": "same"}, {"name": "B", "path": "/b", "id": "same"}]
+    )
+    assign_tile_ids(data)
+    first, second = data["boards"][0]["tiles"]
+    assert first["id"] == "same" and second["id"] not in ("same", "")
+
+
+def test_assign_tile_ids_keeps_existing_ids_before_new_tiles():
+    data = normalize_board_data([{"name": "A", "path": "/a"}])
+    assign_tile_ids(data)
+    original = data["boards"][0]["tiles"][0]["id"]
+    data["boards"][0]["tiles"][0]["path"] = "/moved"
+    data["boards"][0]["tiles"].insert(0, {"name": "New", "path": "/a"})
+    assign_tile_ids(data)
+    new, moved = data["boards"][0]["tiles"]
+    assert moved["id"] == original
+    assert new["id"] not in ("", original)
+
+
+def test_operations_converge_in_any_order():
+    ops = [
+        op("add", "t1", 1, "a", fields={"name": "One"}, board="Main", pos=1.0),
+        op("add", "t2", 2, "a", fields={"name": "Two"}, board="Main", pos=2.0),
+        op("edit", "t1", 3, "a", fields={"name": "Uno"}),
+        op("edit", "t1", 3, "b", fields={"name": "Eins"}),
+        op("move", "t2", 4, "b", board="Main", pos=0.5),
+        op("remove", "t2", 4, "a"),
+        op("edit", "t1", 5, "a", fields={"description": "first"}),
+        op("edit", "t1", 6, "b", fields={"description": None}),
+    ]
+    results = []
+    for seed in range(10):
+        shuffled = list(ops)
+        random.Random(seed).shuffle(shuffled)
+        tiles = {}
+        for item in shuffled:
+            apply_operation(tiles, item)
+        results.append(materialize(tiles))
+    assert all(result == results[0] for result in results)
+    # (3, "b") beats (3, "a"); the move at (4, "b") outlives the remove at (4, "a").
+    assert results[0] == {
+        "Main": [{"id": "t2", "name": "Two"}, {"id": "t1", "name": "Eins"}]
+    }
+
+
+def test_remove_wins_over_older_edits():
+    tiles = {}
+    apply_operation(
+        tiles, op("add", "t1", 1, "a", fields={"name": "One"}, board="Main", pos=1.0)
+    )
+    apply_operation(tiles, op("edit", "t1", 2, "b", fields={"name": "Uno"}))
+    apply_operation(tiles, op("remove", "t1", 3, "a"))
+    assert materialize(tiles) == {}
+    apply_operation(tiles, op("edit", "t1", 4, "b", fields={"name": "Back"}))
+    assert materialize(tiles) == {"Main": [{"id": "t1", "name": "Back"}]}
+
+
+def test_diff_operations_emits_small_deltas():
+    tiles = {}
+    for index, name in enumerate(["A", "B", "C", "D"]):
+        apply_operation(
+            tiles,
+            op(
+                "add",
+                name.lower(),
+                index + 1,
+                "a",
+                fields={"name": name, "note": "x"},
+                board="Main",
+                pos=float(index + 1),
+            ),
+        )
+    local = {
+        "boards": [
+            board(
+                {"id": "b", "name": "B", "note": "x"},
+                {"id": "c", "name": "C", "note": "x"},
+                {"id": "a", "name": "A", "note": "x"},
+                {"id": "e", "name": "E"},
+            ),
+            board({"id": "d", "name": "D"}, name="Other"),
+        ]
+    }
+    ops = diff_operations(tiles, local)
+    assert ops == [
+        {"op": "move", "tile": "a", "board": "Main", "pos": 4.0},
+        {"op": "add", "tile": "e", "fields": {"name": "E"}, "board": "Main", "pos": 5.0},
+        {"op": "edit", "tile": "d", "fields": {"note": None}},
+        {"op": "move", "tile": "d", "board": "Other", "pos": 1.0},
+    ]
+    for index, item in enumerate(ops):
+        apply_operation(tiles, dict(item, clock=10 + index, host="a"))
+    assert diff_operations(tiles, local) == []
+
+
+def test_directory_transport_pulls_only_new_operations(tmp_path):
+    transport = DirectoryTransport(tmp_path / "shared")
+    assert transport.pull(0) == ([], 0)
+    first = [op("remove", "t1", 1, "a")]
+    version = transport.push(first)
+    assert transport.pull(0) == (first, version)
+    second = [op("remove", "t2", 2, "b")]
+    transport.push(second)
+    ops, latest = transport.pull(version)
+    assert ops == second and latest > version
+    with open(transport.path, "ab") as handle:
+        handle.write(b'{"op": "remove"')
+    assert transport.pull(latest) == ([], latest)
+
+
+def test_clients_sync_through_shared_directory(tmp_path):
+    shared = DirectoryTransport(tmp_path / "shared")
+    alice = SyncClient(tmp_path / "alice.json", shared, ALICE_RULES)
+    bob = SyncClient(tmp_path / "bob.json", shared, BOB_RULES)
+
+    alice_data = alice.sync(
+        [
+            {"name": "Serve", "path": "/home/alice/team/serve.py"},
+            {"name": "Notes", "path": "/home/alice/notes.md"},
+        ]
+    )
+    bob_data = bob.sync({"boards": [board(name="Main")], "active_board": "Main"})
+    assert names(bob_data) == ["Serve", "Notes"]
+    assert bob_data["boards"][0]["tiles"][0]["path"] == "/Users/bob/work/team/serve.py"
+    assert bob_data["active_board"] == "Main"
+
+    serve, notes = bob_data["boards"][0]["tiles"]
+    bob_data["boards"][0]["tiles"] = [notes, dict(serve, description="Bob's edit")]
+    bob_data["boards"].append(board({"name": "Logs", "path": "/var/log/syslog"}, name="Ops"))
+    bob.sync(bob_data)
+
+    alice_data["boards"][0]["tiles"][0]["name"] = "Serve API"
+    alice_data = alice.sync(alice_data)
+    assert names(alice_data) == ["Notes", "Serve API"]
+    assert alice_data["boards"][0]["tiles"][1]["description"] == "Bob's edit"
+    assert alice_data["boards"][0]["tiles"][1]["path"] == "/home/alice/team/serve.py"
+    assert names(alice_data, "Ops") == ["Logs"]
+
+    bob_data = bob.sync(bob_data)
+    assert [entry["tiles"] for entry in bob_data["boards"]] == [
+        [bob_view(tile) for tile in entry["tiles"]] for entry in alice_data["boards"]
+    ]
+
+
+def test_joining_with_a_stale_copy_keeps_remote_edits(tmp_path):
+    shared = DirectoryTransport(tmp_path / "shared")
+    original = [{"name": f"T{index}", "path": f"/tools/t{index}"} for index in range(8)]
+    alice = SyncClient(tmp_path / "alice.json", shared)
+    alice_data = alice.sync(original)
+    alice_data["boards"][0]["tiles"][6]["description"] = "new"
+    del alice_data["boards"][0]["tiles"][7]
+    alice_data = alice.sync(alice_data)
+
+    stale = [dict(tile) for tile in original]
+    stale[6]["description"] = "old"
+    own = [{"name": f"B{index}", "path": f"/bob/b{index}"} for index in range(10)]
+    bob = SyncClient(tmp_path / "bob.json", shared)
+    bob_data = bob.sync(own + stale)
+    assert names(bob_data) == [f"B{index}" for index in range(10)] + [
+        f"T{index}" for index in range(7)
+    ]
+    assert bob_data["boards"][0]["tiles"][16]["description"] == "new"
+
+    alice_data = alice.sync(alice_data)
+    assert alice_data["boards"] == bob_data["boards"]
+
+
+def test_unsent_operations_survive_a_failed_push(tmp_path):
+    class OfflineTransport:
+        def pull(self, since):
+            return [], since
+
+        def push(self, ops):
+            raise SyncError("offline")
+
+    shared = DirectoryTransport(tmp_path / "shared")
+    client = SyncClient(tmp_path / "state.json", OfflineTransport())
+    with pytest.raises(SyncError):
+        client.sync([{"name": "A", "path": "/a"}])
+    client.transport = shared
+    data = client.sync([{"name": "A", "path": "/a"}])
+    assert names(data) == ["A"]
+    ops, _ = shared.pull(0)
+    assert [item["op"] for item in ops] == ["add"]
+
+
+def test_http_server_round_trip(tmp_path):
+    server = make_sync_server(tmp_path / "server", port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_port}"
+        first = SyncClient(tmp_path / "first.json", HttpTransport(url))
+        second = SyncClient(tmp_path / "second.json", HttpTransport(url))
+        first.sync([{"name": "A", "path": "/a"}])
+        assert names(second.sync([])) == ["A"]
+
+        with pytest.raises(SyncError):
+            HttpTransport(url).push([{"op": "explode"}])
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+import tracing
+
+
+@pytest.fixture
+def enabled_tracing():
+    was_enabled = tracing.is_enabled()
+    tracing.enable()
+    tracing.clear()
+    yield
+    tracing.clear()
+    if was_enabled:
+        tracing.enable()
+    else:
+        tracing.disable()
+
+
+def test_disabled_span_and_decorator_are_no_ops(enabled_tracing):
+    tracing.disable()
+
+    def work():
+        return 42
+
+    assert tracing.traced("work")(work) is work
+    with tracing.span("idle"):
+        pass
+    assert tracing.recent_spans() == []
+
+
+def test_spans_are_recorded_newest_first(enabled_tracing):
+    @tracing.traced("decorated")
+    def work():
+        return 7
+
+    with tracing.span("outer", count=3):
+        assert work() == 7
+
+    spans = tracing.recent_spans()
+    assert [span["name"] for span in spans] == ["outer", "decorated"]
+    assert spans[0]["args"] == {"count": 3}
+    assert all(span["duration_ms"] >= 0 for span in spans)
+
+
+def test_export_chrome_trace(enabled_tracing, tmp_path):
+    with tracing.span("load", path="/tmp/x"):
+        pass
+    path = tmp_path / "trace.json"
+    tracing.export_chrome_trace(path)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    (event,) = data["traceEvents"]
+    assert event["name"] == "load"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+    assert event["args"] == {"path": "/tmp/x"}
@@ -0,0 +1,142 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+TRACE_ENV = "APPBOARD_TRACE"
+DEFAULT_TRACE_FILE = "appboard-trace.json"
+MAX_EVENTS = 200000
+RECENT_EVENTS = 200
+
+_enabled = False
+_events = deque(maxlen=MAX_EVENTS)
+_recent = deque(maxlen=RECENT_EVENTS)
+_origin_ns = time.perf_counter_ns()
+
+
+def is_enabled():
+    return _enabled
+
+
+def enable():
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def clear():
+    _events.clear()
+    _recent.clear()
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record(self.name, self.start, time.perf_counter_ns(), self.args)
+        return False
+
+
+def span(name, **args):
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name):
+    def decorate(func):
+        if not _enabled:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, start, time.perf_counter_ns(), None)
+
+        return wrapper
+
+    return decorate
+
+
+def record(name, start_ns, end_ns, args):
+    event = (name, start_ns, end_ns, threading.get_ident(), args)
+    _events.append(event)
+    _recent.append(event)
+
+
+def recent_spans(limit=RECENT_EVENTS):
+    events = list(_recent)[-limit:]
+    return [
+        {"name": name, "duration_ms": (end - start) / 1e6, "args": args or {}}
+        for name, start, end, _, args in reversed(events)
+    ]
+
+
+def chrome_trace():
+    pid = os.getpid()
+    trace_events = []
+    for name, start, end, tid, args in list(_events):
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": (start - _origin_ns) / 1000,
+            "dur": (end - start) / 1000,
+            "pid": pid,
+            "tid": tid,
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        trace_events.append(event)
+    return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+
+def export_chrome_trace(path):
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(chrome_trace(), handle)
+
+
+def _trace_path(value):
+    if value.lower() in ("1", "true", "yes", "on"):
+        return DEFAULT_TRACE_FILE
+    return value
+
+
+def _configure_from_env():
+    value = os.environ.get(TRACE_ENV, "").strip()
+    if not value or value.lower() in ("0", "false", "no", "off"):
+        return
+    enable()
+    atexit.register(export_chrome_trace, _trace_path(value))
+
+
+_configure_from_env()